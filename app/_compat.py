@@ -0,0 +1,13 @@
+"""
+Runtime compatibility shims for LangChain API drift.
+
+Imported once at process start; patches symbols in memory instead of
+rewriting source files.
+"""
+import langchain.agents
+from langchain.agents import create_tool_calling_agent
+
+# Newer LangChain releases drop create_openai_tools_agent; the generic
+# tool-calling constructor takes the same (llm, tools, prompt) arguments
+if not hasattr(langchain.agents, "create_openai_tools_agent"):
+    langchain.agents.create_openai_tools_agent = create_tool_calling_agent
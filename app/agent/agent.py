@@ -1,20 +1,101 @@
 """
 Main agent orchestrator that connects the LLM with tools and manages the conversation flow.
 """
-from typing import List, Dict, Any, Optional
+import time
+import asyncio
+import functools
+import logging
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Tuple
 from langchain.agents import AgentExecutor, create_tool_calling_agent
 from langchain_core.agents import AgentAction, AgentFinish
 from langchain_openai import ChatOpenAI  # This is a placeholder, we'll use Groq
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
 from langchain_core.tools import BaseTool
+from cachetools import TTLCache
 
 from app.agent.llm import get_llm
-from app.agent.tools.binance_tool import BinancePriceTool
+from app.agent.tools.binance_tool import BinancePriceTool, BinanceBatchPriceTool
 from app.agent.tools.kb_tool import KnowledgeBaseTool
 from app.agent.tools.rejection_tool import RejectionTool
 from app.agent.prompts import SYSTEM_PROMPT
 from app.config import settings
+from app.metrics import AGENT_LATENCY
+
+logger = logging.getLogger(__name__)
+
+# Built once at import; the template is identical for every agent instance
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages([
+    ("system", SYSTEM_PROMPT),
+    MessagesPlaceholder(variable_name="chat_history"),
+    ("human", "{input}"),
+    MessagesPlaceholder(variable_name="agent_scratchpad")
+])
+
+def _initialize_tools() -> List[BaseTool]:
+    """Initialize and return the tools used by the agent."""
+    tools = []
+    
+    try:
+        binance_tool = BinancePriceTool()
+        tools.append(binance_tool)
+        logger.info("✅ Successfully initialized: %s", binance_tool.name)
+    except Exception as e:
+        logger.error("❌ Failed to initialize BinancePriceTool: %s", e)
+    
+    try:
+        binance_batch_tool = BinanceBatchPriceTool()
+        tools.append(binance_batch_tool)
+        logger.info("✅ Successfully initialized: %s", binance_batch_tool.name)
+    except Exception as e:
+        logger.error("❌ Failed to initialize BinanceBatchPriceTool: %s", e)
+    
+    try:
+        kb_tool = KnowledgeBaseTool()
+        tools.append(kb_tool)
+        logger.info("✅ Successfully initialized: %s", kb_tool.name)
+    except Exception as e:
+        logger.error("❌ Failed to initialize KnowledgeBaseTool: %s", e)
+    
+    try:
+        rejection_tool = RejectionTool()
+        tools.append(rejection_tool)
+        logger.info("✅ Successfully initialized: %s", rejection_tool.name)
+    except Exception as e:
+        logger.error("❌ Failed to initialize RejectionTool: %s", e)
+    
+    logger.info("📋 Total tools initialized: %d", len(tools))
+    if logger.isEnabledFor(logging.DEBUG):
+        for tool in tools:
+            logger.debug("  - %s: %s...", tool.name, tool.description[:100])
+    
+    return tools
+
+@functools.lru_cache(maxsize=1)
+def _shared_executor() -> AgentExecutor:
+    """
+    Create the LangChain agent executor once per process.
+    
+    The LLM, tools and executor hold no per-conversation state, so every
+    CryptoAgent shares them; only session memory lives on the instance.
+    
+    Returns:
+        The shared agent executor
+    """
+    llm = get_llm()
+    tools = _initialize_tools()
+    
+    # Create agent with tools using the newer LangChain approach
+    agent = create_tool_calling_agent(llm, tools, _PROMPT_TEMPLATE)
+    
+    return AgentExecutor(
+        agent=agent,
+        tools=tools,
+        verbose=True,
+        handle_parsing_errors=True,
+        return_intermediate_steps=True
+    )
 
 class CryptoAgent:
     """
@@ -23,114 +104,127 @@ class CryptoAgent:
     
     def __init__(self):
         """Initialize the Crypto Agent with LLM and tools."""
-        self.llm = get_llm()
-        self.tools = self._initialize_tools()
-        self.agent_executor = self._create_agent_executor()
-        self.memory = []  # Simple list to store conversation history
-
-        
-    def _initialize_tools(self) -> List[BaseTool]:
-        """Initialize and return the tools used by the agent."""
-        tools = []
-        
-        try:
-            binance_tool = BinancePriceTool()
-            tools.append(binance_tool)
-            print(f"✅ Successfully initialized: {binance_tool.name}")
-        except Exception as e:
-            print(f"❌ Failed to initialize BinancePriceTool: {e}")
-        
-        try:
-            kb_tool = KnowledgeBaseTool()
-            tools.append(kb_tool)
-            print(f"✅ Successfully initialized: {kb_tool.name}")
-        except Exception as e:
-            print(f"❌ Failed to initialize KnowledgeBaseTool: {e}")
-        
-        try:
-            rejection_tool = RejectionTool()
-            tools.append(rejection_tool)
-            print(f"✅ Successfully initialized: {rejection_tool.name}")
-        except Exception as e:
-            print(f"❌ Failed to initialize RejectionTool: {e}")
-        
-        print(f"📋 Total tools initialized: {len(tools)}")
-        for tool in tools:
-            print(f"  - {tool.name}: {tool.description[:100]}...")
-        
-        return tools
-        
+        self.agent_executor = _shared_executor()
+        self.tools = self.agent_executor.tools
+        # Append-only conversation history per session; see _update_memory for truncation.
+        # Idle sessions are evicted after SESSION_TTL to bound memory.
+        self._sessions: TTLCache = TTLCache(maxsize=settings.MAX_SESSIONS, ttl=settings.SESSION_TTL)
+    
+    def close(self) -> None:
+        """Drop all session memory held by this agent."""
+        self._sessions.clear()
     
-    def _create_agent_executor(self) -> AgentExecutor:
-        """Create and return the LangChain agent executor."""
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", SYSTEM_PROMPT),
-            MessagesPlaceholder(variable_name="chat_history"),
-            ("human", "{input}"),
-            MessagesPlaceholder(variable_name="agent_scratchpad")
-        ])
+    def get_history(self, session_id: str) -> List[BaseMessage]:
+        """
+        Get the stored chat history of a session.
         
-        # Create agent with tools using the newer LangChain approach
-        agent = create_tool_calling_agent(self.llm, self.tools, prompt)
+        Args:
+            session_id: The session identifier
+            
+        Returns:
+            The session's messages (empty if unknown)
+        """
+        return self._sessions.get(session_id, [])
+    
+    def set_history(self, session_id: str, messages: List[BaseMessage]) -> None:
+        """
+        Replace the chat history of a session, e.g. after loading it from shared storage.
         
-        return AgentExecutor(
-            agent=agent,
-            tools=self.tools,
-            verbose=True,
-            handle_parsing_errors=True,
-            return_intermediate_steps=True
-        )
+        Args:
+            session_id: The session identifier
+            messages: The session's messages
+        """
+        self._sessions[session_id] = list(messages)
     
-    def _update_memory(self, user_input: str, assistant_response: str):
+    def _update_memory(self, session_id: str, user_input: str, assistant_response: str):
         """
         Update the conversation memory with the latest exchange.
         
         Args:
+            session_id: The session the exchange belongs to
             user_input: The user's message
             assistant_response: The agent's response
         """
-        # Add the latest exchange to memory
-        self.memory.append({"role": "human", "content": user_input})
-        self.memory.append({"role": "assistant", "content": assistant_response})
+        history = self._sessions.get(session_id, [])
         
-        # Trim memory to configured window size
-        if len(self.memory) > settings.MEMORY_WINDOW * 2:  # *2 because each exchange has 2 messages
-            self.memory = self.memory[-settings.MEMORY_WINDOW * 2:]
+        # Add the latest exchange to memory
+        history.append(HumanMessage(content=user_input))
+        history.append(AIMessage(content=assistant_response))
+        
+        # Expanding window: let history grow to twice the configured window and
+        # only then cut back to the window. Between cuts every request shares the
+        # previous request's prefix, so provider-side prompt caching keeps hitting.
+        window = settings.MEMORY_WINDOW * 2  # *2 because each exchange has 2 messages
+        if len(history) > window * 2:
+            del history[:-window]
+        
+        # Re-inserting refreshes the session's TTL
+        self._sessions[session_id] = history
     
-    def _format_chat_history(self) -> List[Dict[str, str]]:
-        """Format the memory into chat history messages for the agent."""
-        chat_history = []
-        
-        for msg in self.memory:
-            if msg["role"] == "human":
-                chat_history.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "assistant":
-                chat_history.append(AIMessage(content=msg["content"]))
-        
-        return chat_history
+    def _format_chat_history(self, session_id: str) -> List[BaseMessage]:
+        """Format the memory of a session into chat history messages for the agent."""
+        return list(self._sessions.get(session_id, ()))
     
-    async def process_message(self, user_input: str) -> str:
+    async def process_message(self, user_input: str, session_id: str = "default") -> str:
         """
         Process a user message and return the agent's response.
         
         Args:
             user_input: The user's message
+            session_id: The session whose conversation history is used
             
         Returns:
             The agent's response
         """
-        chat_history = self._format_chat_history()
+        chat_history = self._format_chat_history(session_id)
         
         # Execute the agent with the user input and chat history
-        response = await self.agent_executor.ainvoke({
-            "input": user_input,
-            "chat_history": chat_history
-        })
+        start = time.perf_counter()
+        status = "error"
+        try:
+            response = await self.agent_executor.ainvoke({
+                "input": user_input,
+                "chat_history": chat_history
+            })
+            status = "ok"
+        finally:
+            AGENT_LATENCY.labels(status).observe(time.perf_counter() - start)
         
         # Get the final output
         output = response["output"]
         
         # Update memory with this exchange
-        self._update_memory(user_input, output)
+        self._update_memory(session_id, user_input, output)
+        
+        return output
+    
+    async def process_messages(self, inputs: List[Tuple[str, str]], max_concurrency: int = 8) -> List[str]:
+        """
+        Process messages from several sessions concurrently.
+        
+        Messages for different sessions run in parallel (bounded by
+        max_concurrency); messages for the same session run in order so each
+        one sees the previous exchange in its history.
+        
+        Args:
+            inputs: List of (session_id, user_input) pairs
+            max_concurrency: Maximum number of sessions processed at once
+            
+        Returns:
+            The agent's responses, in the same order as inputs
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        results: List[Optional[str]] = [None] * len(inputs)
+        
+        by_session: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+        for index, (session_id, user_input) in enumerate(inputs):
+            by_session[session_id].append((index, user_input))
+        
+        async def run_session(session_id: str, items: List[Tuple[int, str]]):
+            async with semaphore:
+                for index, user_input in items:
+                    results[index] = await self.process_message(user_input, session_id)
+        
+        await asyncio.gather(*(run_session(sid, items) for sid, items in by_session.items()))
         
-        return output
\ No newline at end of file
+        return results
\ No newline at end of file
@@ -44,9 +44,8 @@ def get_llm(model_name: Optional[str] = None) -> BaseChatModel:
             max_tokens=settings.LLM_MAX_TOKENS,
         )
         
-        # Test the connection with a simple call
-        test_response = llm.invoke([HumanMessage(content="Hello")])
-        print(f"LLM initialized successfully with model: {model}")
+        # The connection is opened lazily on the first real request
+        print(f"LLM initialized with model: {model}")
         
         return llm
         
@@ -64,6 +63,26 @@ def get_llm(model_name: Optional[str] = None) -> BaseChatModel:
         
         return llm
 
+async def healthcheck(llm: Optional[BaseChatModel] = None) -> bool:
+    """
+    Check that the LLM is reachable with a minimal round-trip.
+    
+    This makes a billable request, so call it explicitly rather than at startup.
+    
+    Args:
+        llm: Optional LLM to check (defaults to a fresh get_llm())
+        
+    Returns:
+        True if the LLM responded, False otherwise
+    """
+    llm = llm or get_llm()
+    try:
+        await llm.ainvoke([HumanMessage(content="Hello")])
+        return True
+    except Exception as e:
+        print(f"LLM health check failed: {e}")
+        return False
+
 def create_system_message(content: str) -> SystemMessage:
     """
     Create a system message for the LLM.
@@ -1,8 +1,10 @@
 """
 Prompt templates for the Crypto AI Agent.
 """
+import sys
+from typing import Final
 
-SYSTEM_PROMPT = """You are a specialized cryptocurrency trading assistant. Your mission is to help users with crypto trading and market analysis.
+SYSTEM_PROMPT: Final[str] = sys.intern("""You are a specialized cryptocurrency trading assistant. Your mission is to help users with crypto trading and market analysis.
 
 🎯 YOUR EXPERTISE:
 - Real-time cryptocurrency prices and market data
@@ -42,7 +44,7 @@ SYSTEM_PROMPT = """You are a specialized cryptocurrency trading assistant. Your
 - Keep it chat-friendly and easy to read
 
 Remember: You're exclusively focused on cryptocurrency trading assistance!
-"""
+""")
 
 KB_QUERY_PROMPT = """Based on the conversation context and user question, create a focused search query for the cryptocurrency knowledge base.
 
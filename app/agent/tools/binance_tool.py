@@ -1,22 +1,432 @@
 """
 Binance API integration tool for retrieving cryptocurrency price and market data.
 """
+import re
 import time
 import hmac
 import hashlib
+import logging
+import asyncio
+import threading
+import weakref
+from datetime import datetime, timezone
 import requests
-from typing import Dict, Any, Optional, List, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cachetools import TTLCache
+from typing import Dict, Any, Optional, List, Union, Iterable, Iterator
+from urllib.parse import urlencode
 from pydantic import BaseModel, Field
-import json
+import orjson
 from langchain_core.tools import BaseTool
 from app.config import settings
+from app.metrics import TOOL_LATENCY
+
+# ijson is optional; without it large kline responses are parsed in one go
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# httpx is optional; without it async calls fall back to a worker thread
+try:
+    import httpx
+except ImportError:
+    print("Warning: httpx not available, async Binance calls will run in a thread. Install with: pip install httpx[http2]")
+    httpx = None
+
+# HTTP/2 multiplexing needs the h2 package; fall back to HTTP/1.1 keep-alive without it
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class _InvalidRequestError(Exception):
+    """Binance rejected the request's parameters (HTTP 400), e.g. an unknown symbol."""
 
 
 class BinancePriceRequest(BaseModel):
-    """Schema for Binance price request parameters."""
+    """
+    Schema for Binance price request parameters.
+    
+    Served by a single /api/v3/ticker/24hr call, whose lastPrice doubles as the current price.
+    """
     symbol: str = Field(..., description="Trading pair symbol like BTCUSDT, ETHUSDT")
 
 
+# Cheap shape check that rejects obviously malformed tickers before any lookup
+_SYMBOL_RE = re.compile(r"^[A-Z0-9]{5,20}$")
+
+# How long the exchangeInfo symbol list is trusted, and how soon to retry a failed load
+_SYMBOLS_REFRESH_SECONDS = 24 * 60 * 60
+_SYMBOLS_RETRY_SECONDS = 60
+
+# Tradable symbols from exchangeInfo, shared by every tool instance; None until first loaded
+_valid_symbols: Optional[frozenset] = None
+_valid_symbols_expiry = 0.0
+_valid_symbols_lock = threading.Lock()
+
+# Binance allows 1200 request weight per minute; stay safely below it
+_MAX_CONCURRENT_REQUESTS = 6
+_WEIGHT_PER_MINUTE = 1000
+_MAX_RATE_LIMIT_RETRIES = 3
+_MAX_RETRY_AFTER_SECONDS = 10
+# Larger multi-symbol batches jump from weight 2 to 40 and degrade latency
+_MAX_BATCH_SYMBOLS = 20
+
+# Request weight per endpoint, per the Binance REST API docs
+_ENDPOINT_WEIGHTS = {
+    "/api/v3/ticker/price": 2,
+    "/api/v3/ticker/24hr": 2,
+    "/api/v3/exchangeInfo": 20,
+}
+
+
+# Shared by every tool instance so HTTP/2 connections are multiplexed between calls.
+# Pooled connections belong to the loop that opened them, so there is one client per loop
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+async def _get_session() -> "httpx.AsyncClient":
+    """
+    Get or lazily create the shared httpx client for the running event loop.
+    
+    Returns:
+        This loop's httpx AsyncClient
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.is_closed:
+        session = _sessions[loop] = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=32, keepalive_expiry=60)
+        )
+    return session
+
+
+async def close_session() -> None:
+    """Close the running event loop's httpx client, if one was opened."""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.is_closed:
+        await session.aclose()
+
+
+def _loop_inflight(table: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]") -> Dict[Any, asyncio.Future]:
+    """
+    Get the running event loop's in-flight futures from a per-loop table.
+    
+    Args:
+        table: Mapping of event loop to its in-flight futures
+        
+    Returns:
+        This loop's dict of in-flight futures
+    """
+    loop = asyncio.get_running_loop()
+    inflight = table.get(loop)
+    if inflight is None:
+        inflight = table[loop] = {}
+    return inflight
+
+
+# Raw response TTLs in seconds per endpoint; endpoints not listed are never cached
+_RESPONSE_TTLS = {
+    "/api/v3/ticker/price": 2,
+    # Source of current_price, so it must stay as fresh as /ticker/price
+    "/api/v3/ticker/24hr": 2,
+    "/api/v3/klines": 60,
+}
+_response_caches = {endpoint: TTLCache(maxsize=1024, ttl=ttl) for endpoint, ttl in _RESPONSE_TTLS.items()}
+_response_cache_lock = threading.Lock()
+# In-flight async requests keyed like the cache, shared by concurrent misses on the same loop
+_inflight_requests: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple, asyncio.Future]]" = weakref.WeakKeyDictionary()
+
+
+def _response_cache_key(endpoint: str, params: Optional[Dict[str, Any]]) -> tuple:
+    """Build the cache key for a request."""
+    return (endpoint, frozenset((params or {}).items()))
+
+
+def _get_cached_response(endpoint: str, params: Optional[Dict[str, Any]]) -> Optional[Any]:
+    """Return a cached API response, if the endpoint is cacheable and still fresh."""
+    cache = _response_caches.get(endpoint)
+    if cache is None:
+        return None
+    with _response_cache_lock:
+        return cache.get(_response_cache_key(endpoint, params))
+
+
+def _set_cached_response(endpoint: str, params: Optional[Dict[str, Any]], data: Any) -> None:
+    """Store an API response if the endpoint is cacheable."""
+    cache = _response_caches.get(endpoint)
+    if cache is None:
+        return
+    with _response_cache_lock:
+        cache[_response_cache_key(endpoint, params)] = data
+
+
+class _TokenBucket:
+    """Token bucket for Binance request weight, refilled continuously."""
+    
+    def __init__(self, rate: float, capacity: float):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+    
+    async def acquire(self, amount: float) -> None:
+        """
+        Wait until the given weight can be spent, then spend it.
+        
+        Args:
+            amount: Request weight to consume
+        """
+        amount = min(amount, self._capacity)
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return
+            await asyncio.sleep((amount - self._tokens) / self._rate)
+
+
+def _chunk_symbols(symbols: List[str]) -> Iterator[str]:
+    """
+    Split symbols into encoded symbols=[...] parameters of bounded size.
+    
+    Args:
+        symbols: Cryptocurrency trading pairs
+        
+    Returns:
+        Iterator of JSON-encoded symbol lists
+    """
+    symbols = [s.upper() for s in symbols]
+    for i in range(0, len(symbols), _MAX_BATCH_SYMBOLS):
+        yield orjson.dumps(symbols[i:i + _MAX_BATCH_SYMBOLS]).decode()
+
+
+def _request_weight(endpoint: str, params: Optional[Dict[str, Any]]) -> int:
+    """
+    Estimate the Binance request weight of a call.
+    
+    Args:
+        endpoint: API endpoint
+        params: Request parameters
+        
+    Returns:
+        Request weight
+    """
+    if endpoint == "/api/v3/ticker/24hr" and params and "symbols" in params:
+        # Multi-symbol 24hr tickers cost 2 up to 20 symbols, 40 up to 100
+        count = params["symbols"].count(",") + 1
+        return 2 if count <= 20 else 40
+    return _ENDPOINT_WEIGHTS.get(endpoint, 2)
+
+
+# asyncio primitives bind to the loop that first contends them, so keep one per loop
+_request_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+_weight_bucket = _TokenBucket(rate=_WEIGHT_PER_MINUTE / 60, capacity=_WEIGHT_PER_MINUTE)
+
+
+
+def _get_request_semaphore() -> asyncio.Semaphore:
+    """
+    Get the concurrency limiter for the running event loop.
+    
+    Returns:
+        This loop's request semaphore
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _request_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _request_semaphores[loop] = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+    return semaphore
+
+# (response key, /ticker/24hr key) pairs for the numeric fields returned to the agent
+_FLOAT_FIELDS: tuple[tuple[str, str], ...] = (
+    ("current_price", "lastPrice"),
+    ("price_change_24h", "priceChange"),
+    ("price_change_percent_24h", "priceChangePercent"),
+    ("high_24h", "highPrice"),
+    ("low_24h", "lowPrice"),
+    ("volume_24h", "volume"),
+    ("quote_volume_24h", "quoteVolume"),
+    ("open_price", "openPrice"),
+    ("close_price", "prevClosePrice"),
+    ("bid_price", "bidPrice"),
+    ("ask_price", "askPrice"),
+)
+
+
+# Kline responses above this many rows are stream-parsed when ijson is available
+_KLINES_STREAM_THRESHOLD = 200
+
+
+def _iter_klines(klines: Iterable[List[Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily convert raw /api/v3/klines rows into dictionaries.
+    
+    Args:
+        klines: Kline rows as returned (or streamed) from Binance
+        
+    Returns:
+        Iterator of OHLCV dictionaries
+    """
+    return (
+        {
+            "open_time": open_time,
+            "open": float(open_),
+            "high": float(high),
+            "low": float(low),
+            "close": float(close),
+            "volume": float(volume),
+            "close_time": close_time
+        }
+        for open_time, open_, high, low, close, volume, close_time, *_ in klines
+    )
+
+
+class _TickerBatcher:
+    """
+    Coalesces concurrent single-symbol 24hr lookups into one batched request.
+    
+    Lookups arriving within the batch window are drained from a queue by a
+    background task, deduplicated and sent as one /ticker/24hr?symbols=[...]
+    call; each awaiting caller then receives its own symbol's statistics.
+    """
+    
+    def __init__(self, window: float):
+        self._window = window
+        # Queue and collector per event loop, so asyncio.run callers each get their own
+        self._workers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple]" = weakref.WeakKeyDictionary()
+        # Strong references to in-flight dispatches so they aren't garbage collected
+        self._dispatches: set = set()
+    
+    async def submit(self, tool: "BinancePriceTool", symbol: str) -> Dict[str, Any]:
+        """
+        Queue a symbol for the next batch and wait for its statistics.
+        
+        Args:
+            tool: Tool instance whose HTTP session is used for the request
+            symbol: Normalized trading pair
+            
+        Returns:
+            24-hour price statistics for the symbol
+        """
+        if self._window <= 0:
+            return await tool._aget_ticker_24hr(symbol)
+        
+        loop = asyncio.get_running_loop()
+        queue, worker = self._workers.get(loop, (None, None))
+        if worker is None or worker.done():
+            queue = asyncio.Queue()
+            worker = loop.create_task(self._run(queue))
+            self._workers[loop] = (queue, worker)
+        
+        future = loop.create_future()
+        await queue.put((tool, symbol, future))
+        return await future
+    
+    async def _run(self, queue: asyncio.Queue) -> None:
+        """
+        Drain the queue one batch window at a time.
+        
+        Each batch is dispatched as its own task so a slow or rate-limited
+        batch never holds up collection of the next one.
+        
+        Args:
+            queue: This event loop's lookup queue
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await queue.get()]
+            deadline = loop.time() + self._window
+            
+            while True:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    pending.append(await asyncio.wait_for(queue.get(), timeout=timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            task = loop.create_task(self._dispatch(pending))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+    
+    async def _dispatch(self, pending: List[tuple]) -> None:
+        """Fetch statistics for a drained batch and resolve its futures."""
+        tool = pending[0][0]
+        symbols = sorted({symbol for _, symbol, _ in pending})
+        
+        try:
+            if len(symbols) == 1:
+                results = {symbols[0]: await tool._aget_ticker_24hr(symbols[0])}
+            else:
+                stats_list = await tool._aget_ticker_24hr_batch(symbols)
+                results = {stats["symbol"]: stats for stats in stats_list}
+        except _InvalidRequestError as e:
+            # Binance rejects the whole batch for a single bad symbol, so retry
+            # individually to keep one hallucinated ticker from failing the rest
+            if len(symbols) == 1:
+                results = {symbols[0]: e}
+            else:
+                fetched = await asyncio.gather(
+                    *(tool._aget_ticker_24hr(symbol) for symbol in symbols),
+                    return_exceptions=True
+                )
+                results = dict(zip(symbols, fetched))
+        except Exception as e:
+            # Rate limits, timeouts and 5xx hit every symbol alike; fanning out
+            # would only add load while Binance is already throttling
+            results = {symbol: e for symbol in symbols}
+        
+        for _, symbol, future in pending:
+            if future.done():
+                continue
+            result = results.get(symbol)
+            if result is None:
+                result = Exception(f"No data returned for {symbol}")
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+_batcher = _TickerBatcher(settings.BINANCE_BATCH_WINDOW_MS / 1000)
+
+
+class BinanceBatchPriceRequest(BaseModel):
+    """Schema for Binance multi-symbol price request parameters."""
+    symbols: List[str] = Field(..., description="List of trading pair symbols like ['BTCUSDT', 'ETHUSDT']")
+
+
+def _set_valid_symbols(info: Optional[Dict[str, Any]]) -> None:
+    """
+    Store the tradable symbols from an exchangeInfo payload.
+    
+    Args:
+        info: exchangeInfo payload, or None if the fetch failed
+    """
+    global _valid_symbols, _valid_symbols_expiry
+    
+    if info is None:
+        _valid_symbols_expiry = time.monotonic() + _SYMBOLS_RETRY_SECONDS
+        return
+    
+    _valid_symbols = frozenset(
+        s["symbol"] for s in info.get("symbols", []) if s.get("status") == "TRADING"
+    )
+    _valid_symbols_expiry = time.monotonic() + _SYMBOLS_REFRESH_SECONDS
+
+
 class BinancePriceTool(BaseTool):
     """Tool for retrieving cryptocurrency price data from Binance."""
     
@@ -29,14 +439,42 @@ class BinancePriceTool(BaseTool):
     """
     args_schema: type[BinancePriceRequest] = BinancePriceRequest
     
-    def __init__(self):
-        """Initialize the Binance tool."""
+    def __init__(self, cache_ttl: float = 3):
+        """
+        Initialize the Binance tool.
+        
+        Args:
+            cache_ttl: Seconds a formatted ticker response is reused for the same symbol
+        """
         super().__init__()
         # Use private attributes to avoid Pydantic field conflicts
         self._api_key = getattr(settings, 'BINANCE_API_KEY', None)
         self._api_secret = getattr(settings, 'BINANCE_API_SECRET', None)
         self._base_url = "https://api.binance.com"
-        print(f"🔧 BinancePriceTool initialized")
+        
+        # Pooled sync session so keep-alive connections are reused across calls
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            # 429 is left to the caller: urllib3 would honour an uncapped Retry-After,
+            # and hammering through rate limits risks a 418 IP ban
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504])
+        )
+        self._session.mount("https://", adapter)
+        if self._api_key:
+            self._session.headers.update({"X-MBX-APIKEY": self._api_key})
+        
+        # Keyed HMAC-SHA256 template; signing copies it instead of re-keying
+        self._secret_bytes = self._api_secret.encode('utf-8') if self._api_secret else None
+        self._hmac_template = hmac.new(self._secret_bytes, digestmod=hashlib.sha256) if self._secret_bytes else None
+        
+        # Short-lived response cache keyed by symbol
+        self._cache = TTLCache(maxsize=256, ttl=cache_ttl)
+        self._cache_lock = threading.Lock()
+        # In-flight async fetches per event loop, shared by concurrent callers for the same symbol
+        self._inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = weakref.WeakKeyDictionary()
+        logger.debug("🔧 BinancePriceTool initialized")
     
     def _generate_signature(self, params: Dict[str, Any]) -> str:
         """
@@ -51,13 +489,9 @@ class BinancePriceTool(BaseTool):
         if not self._api_secret:
             raise Exception("API secret required for signed requests")
             
-        query_string = '&'.join([f"{k}={v}" for k, v in params.items()])
-        signature = hmac.new(
-            self._api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        signature = self._hmac_template.copy()
+        signature.update(urlencode(params).encode('utf-8'))
+        return signature.hexdigest()
     
     def _make_request(self, endpoint: str, params: Dict[str, Any] = None, signed: bool = False) -> Dict[str, Any]:
         """
@@ -72,42 +506,50 @@ class BinancePriceTool(BaseTool):
             API response as a dictionary
         """
         url = f"{self._base_url}{endpoint}"
-        headers = {}
-        
-        # Add API key to headers if available
-        if self._api_key:
-            headers["X-MBX-APIKEY"] = self._api_key
         
         # For signed requests, add timestamp and signature
         if signed and self._api_secret:
             params = params or {}
             params['timestamp'] = int(time.time() * 1000)
             params['signature'] = self._generate_signature(params)
+        else:
+            cached = _get_cached_response(endpoint, params)
+            if cached is not None:
+                return cached
         
+        start = time.perf_counter()
+        status = "error"
         try:
-            print(f"🌐 Making request to: {url}")
-            print(f"📝 Parameters: {params}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🌐 Making request to: %s params=%s", url, params)
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self._session.get(url, params=params, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
-            print(f"✅ API Response received successfully")
+            data = orjson.loads(response.content)
+            logger.debug("✅ API Response received successfully")
+            status = "ok"
+            if not signed:
+                _set_cached_response(endpoint, params, data)
             return data
             
         except requests.exceptions.Timeout:
             raise Exception("Request timed out - Binance API might be slow")
         except requests.exceptions.HTTPError as e:
             if response.status_code == 400:
-                raise Exception(f"Invalid symbol or parameters: {response.text}")
+                raise _InvalidRequestError(f"Invalid symbol or parameters: {response.text}")
             elif response.status_code == 429:
                 raise Exception("Rate limit exceeded - too many requests")
             else:
                 raise Exception(f"HTTP error {response.status_code}: {response.text}")
+        except requests.exceptions.RetryError:
+            raise Exception("Binance unavailable - retries exhausted")
         except requests.exceptions.RequestException as e:
             raise Exception(f"Network error: {str(e)}")
         except ValueError as e:
             raise Exception(f"Invalid JSON response: {str(e)}")
+        finally:
+            TOOL_LATENCY.labels(self.name, endpoint, status).observe(time.perf_counter() - start)
     
     def get_ticker_price(self, symbol: str) -> Dict[str, Any]:
         """
@@ -137,6 +579,74 @@ class BinancePriceTool(BaseTool):
         params = {"symbol": symbol.upper()}
         return self._make_request(endpoint, params)
     
+    def get_ticker_24hr_batch(self, symbols: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get 24hr ticker statistics for several symbols in as few requests as possible.
+        
+        Symbols are sent in chunks of at most _MAX_BATCH_SYMBOLS, the largest
+        batch Binance still weighs at 2.
+        
+        Args:
+            symbols: Cryptocurrency trading pairs (e.g., ["BTCUSDT", "ETHUSDT"])
+            
+        Returns:
+            List of 24-hour price statistics, one per symbol
+        """
+        endpoint = "/api/v3/ticker/24hr"
+        results = []
+        for chunk in _chunk_symbols(symbols):
+            results.extend(self._make_request(endpoint, {"symbols": chunk}))
+        return results
+    
+    def get_klines(self, symbol: str, interval: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get candlestick (kline) data for a symbol.
+        
+        Args:
+            symbol: Cryptocurrency trading pair (e.g., BTCUSDT)
+            interval: Kline interval (e.g., 1m, 1h, 1d)
+            limit: Number of klines to return (max 1000)
+            
+        Returns:
+            List of OHLCV dictionaries
+        """
+        return list(self.iter_klines(symbol, interval, limit))
+    
+    def iter_klines(self, symbol: str, interval: str, limit: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over candlestick (kline) data for a symbol without materializing it.
+        
+        Large responses are parsed row by row straight off the socket, so
+        memory stays flat regardless of limit. Streamed responses bypass the
+        response cache.
+        
+        Args:
+            symbol: Cryptocurrency trading pair (e.g., BTCUSDT)
+            interval: Kline interval (e.g., 1m, 1h, 1d)
+            limit: Number of klines to return (max 1000)
+            
+        Returns:
+            Iterator of OHLCV dictionaries
+        """
+        endpoint = "/api/v3/klines"
+        params = {"symbol": symbol.upper(), "interval": interval, "limit": limit}
+        
+        if ijson is None or limit <= _KLINES_STREAM_THRESHOLD:
+            yield from _iter_klines(self._make_request(endpoint, params))
+            return
+        
+        try:
+            with self._session.get(f"{self._base_url}{endpoint}", params=params, timeout=10, stream=True) as response:
+                if response.status_code == 400:
+                    raise _InvalidRequestError(f"Invalid symbol or parameters: {response.text}")
+                response.raise_for_status()
+                response.raw.decode_content = True
+                yield from _iter_klines(ijson.items(response.raw, "item"))
+        except requests.exceptions.Timeout:
+            raise Exception("Request timed out - Binance API might be slow")
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Network error: {str(e)}")
+    
     def get_exchange_info(self, symbol: str = None) -> Dict[str, Any]:
         """
         Get exchange trading rules and symbol information.
@@ -151,6 +661,264 @@ class BinancePriceTool(BaseTool):
         params = {"symbol": symbol.upper()} if symbol else {}
         return self._make_request(endpoint, params)
     
+    async def _async_make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Make a non-blocking request to the Binance API.
+        
+        Fresh cached responses are returned directly, and concurrent misses
+        for the same request share a single HTTP call.
+        
+        Args:
+            endpoint: API endpoint
+            params: Request parameters
+            
+        Returns:
+            API response as a dictionary
+        """
+        cached = _get_cached_response(endpoint, params)
+        if cached is not None:
+            return cached
+        
+        key = _response_cache_key(endpoint, params)
+        inflight = _loop_inflight(_inflight_requests)
+        future = inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._async_fetch(endpoint, params))
+            inflight[key] = future
+            future.add_done_callback(lambda _: inflight.pop(key, None))
+        
+        return await asyncio.shield(future)
+    
+    async def _async_fetch(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Perform the HTTP call behind _async_make_request and cache the result.
+        
+        Args:
+            endpoint: API endpoint
+            params: Request parameters
+            
+        Returns:
+            API response as a dictionary
+        """
+        url = f"{self._base_url}{endpoint}"
+        headers = {}
+        
+        # Add API key to headers if available
+        if self._api_key:
+            headers["X-MBX-APIKEY"] = self._api_key
+        
+        session = await _get_session()
+        weight = _request_weight(endpoint, params)
+        
+        start = time.perf_counter()
+        status = "error"
+        try:
+            for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+                retry_after = None
+                
+                async with _get_request_semaphore():
+                    await _weight_bucket.acquire(weight)
+                    response = await session.get(url, headers=headers, params=params)
+                    if response.status_code == 429:
+                        retry_after = float(response.headers.get("Retry-After", 0)) or 0.5 * 2 ** attempt
+                    elif response.status_code == 400:
+                        raise _InvalidRequestError(f"Invalid symbol or parameters: {response.text}")
+                    elif response.status_code >= 400:
+                        raise Exception(f"HTTP error {response.status_code}: {response.text}")
+                    else:
+                        data = orjson.loads(response.content)
+                        status = "ok"
+                        _set_cached_response(endpoint, params, data)
+                        return data
+                
+                # Back off outside the semaphore so other requests can proceed
+                if attempt == _MAX_RATE_LIMIT_RETRIES or retry_after > _MAX_RETRY_AFTER_SECONDS:
+                    raise Exception("Rate limit exceeded - too many requests")
+                logger.warning("Binance rate limit hit, retrying in %.1fs", retry_after)
+                await asyncio.sleep(retry_after)
+                
+        except httpx.TimeoutException:
+            raise Exception("Request timed out - Binance API might be slow")
+        except httpx.HTTPError as e:
+            raise Exception(f"Network error: {str(e)}")
+        except ValueError as e:
+            raise Exception(f"Invalid JSON response: {str(e)}")
+        finally:
+            TOOL_LATENCY.labels(self.name, endpoint, status).observe(time.perf_counter() - start)
+    
+    async def _aget_ticker_price(self, symbol: str) -> Dict[str, Any]:
+        """Async version of get_ticker_price."""
+        return await self._async_make_request("/api/v3/ticker/price", {"symbol": symbol.upper()})
+    
+    async def _aget_ticker_24hr(self, symbol: str) -> Dict[str, Any]:
+        """Async version of get_ticker_24hr."""
+        return await self._async_make_request("/api/v3/ticker/24hr", {"symbol": symbol.upper()})
+    
+    async def _aget_ticker_24hr_batch(self, symbols: List[str]) -> List[Dict[str, Any]]:
+        """Async version of get_ticker_24hr_batch."""
+        chunks = await asyncio.gather(*(
+            self._async_make_request("/api/v3/ticker/24hr", {"symbols": chunk})
+            for chunk in _chunk_symbols(symbols)
+        ))
+        return [stats for chunk in chunks for stats in chunk]
+    
+    def _normalize_symbol(self, symbol: str) -> str:
+        """
+        Clean and validate a trading pair symbol.
+        
+        Args:
+            symbol: Raw symbol as supplied by the caller
+            
+        Returns:
+            Uppercased, stripped symbol
+        """
+        # Ensure symbol is uppercase and clean
+        symbol = symbol.upper().strip()
+        
+        # Validate symbol format
+        if not _SYMBOL_RE.match(symbol):
+            raise Exception(f"Invalid symbol format: {symbol}. Use format like BTCUSDT")
+        
+        # Reject unknown pairs without a round-trip once the symbol list is loaded
+        if _valid_symbols is not None and symbol not in _valid_symbols:
+            raise Exception(f"Unknown symbol: {symbol}. Use a Binance trading pair like BTCUSDT")
+        
+        return symbol
+    
+    def _refresh_valid_symbols(self) -> None:
+        """Load the shared tradable symbol list if it is missing or stale."""
+        if time.monotonic() < _valid_symbols_expiry:
+            return
+        # One thread refetches while the others carry on with the current list
+        if not _valid_symbols_lock.acquire(blocking=False):
+            return
+        try:
+            if time.monotonic() < _valid_symbols_expiry:
+                return
+            try:
+                info = self._make_request("/api/v3/exchangeInfo", {"symbolStatus": "TRADING"})
+            except Exception as e:
+                logger.warning("Could not load Binance symbol list: %s", e)
+                info = None
+            _set_valid_symbols(info)
+        finally:
+            _valid_symbols_lock.release()
+    
+    async def _arefresh_valid_symbols(self) -> None:
+        """Async version of _refresh_valid_symbols."""
+        global _valid_symbols_expiry
+        
+        if time.monotonic() < _valid_symbols_expiry:
+            return
+        # Push the expiry out first so concurrent callers don't all refetch
+        _valid_symbols_expiry = time.monotonic() + _SYMBOLS_RETRY_SECONDS
+        try:
+            info = await self._async_make_request("/api/v3/exchangeInfo", {"symbolStatus": "TRADING"})
+        except Exception as e:
+            logger.warning("Could not load Binance symbol list: %s", e)
+            info = None
+        _set_valid_symbols(info)
+    
+    def _build_response(self, symbol: str, stats_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the price information for a single symbol.
+        
+        Args:
+            symbol: Normalized trading pair
+            stats_data: Payload from /api/v3/ticker/24hr
+            
+        Returns:
+            Price information as a dictionary
+        """
+        # Convert the numeric fields in one pass
+        response = {out: float(stats_data.get(src, 0)) for out, src in _FLOAT_FIELDS}
+        
+        # Determine trend
+        price_change_percent = response["price_change_percent_24h"]
+        trend_emoji = "📈" if price_change_percent > 0 else "📉" if price_change_percent < 0 else "➡️"
+        
+        response["price_change_percent_24h"] = round(price_change_percent, 2)
+        now = time.time()
+        response.update({
+            "symbol": symbol,
+            "timestamp": stats_data.get("closeTime", int(now * 1000)),
+            "trend": trend_emoji,
+            "data_source": "Binance API",
+            "status": "LIVE",
+            "last_updated": datetime.fromtimestamp(now, timezone.utc).isoformat(timespec="seconds")
+        })
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "✅ LIVE data for %s: price=$%s change=%s%% %s",
+                symbol, response["current_price"], response["price_change_percent_24h"], trend_emoji
+            )
+        
+        return response
+    
+    def _format_response(self, symbol: str, stats_data: Dict[str, Any]) -> str:
+        """
+        Build the JSON payload returned to the agent.
+        
+        Args:
+            symbol: Normalized trading pair
+            stats_data: Payload from /api/v3/ticker/24hr
+            
+        Returns:
+            Formatted price information as a JSON string
+        """
+        return orjson.dumps(self._build_response(symbol, stats_data), option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def _format_error(self, symbol: str, error: Exception) -> str:
+        """
+        Build the JSON error payload returned to the agent.
+        
+        Args:
+            symbol: Trading pair the request was made for
+            error: The exception that was raised
+            
+        Returns:
+            Error information as a JSON string
+        """
+        error_msg = f"Failed to retrieve live price data for {symbol}: {str(error)}"
+        logger.warning("❌ %s", error_msg)
+        
+        error_response = {
+            "error": True,
+            "message": error_msg,
+            "symbol": symbol,
+            "data_source": "Binance API",
+            "status": "ERROR",
+            "timestamp": int(time.time() * 1000)
+        }
+        
+        return orjson.dumps(error_response, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def _get_cached(self, symbol: str) -> Optional[str]:
+        """Return the cached response for a symbol, if still fresh."""
+        with self._cache_lock:
+            return self._cache.get(symbol)
+    
+    def _set_cached(self, symbol: str, result: str) -> None:
+        """Store a formatted response for a symbol."""
+        with self._cache_lock:
+            self._cache[symbol] = result
+    
+    async def _afetch(self, symbol: str) -> str:
+        """
+        Fetch, format and cache the response for a symbol.
+        
+        Args:
+            symbol: Normalized trading pair
+            
+        Returns:
+            Formatted price information as a JSON string
+        """
+        stats_data = await _batcher.submit(self, symbol)
+        result = self._format_response(symbol, stats_data)
+        self._set_cached(symbol, result)
+        return result
+    
     def _run(self, symbol: str) -> str:
         """
         Run the tool to get cryptocurrency price information from Binance API.
@@ -162,82 +930,140 @@ class BinancePriceTool(BaseTool):
             Formatted price information as a JSON string
         """
         try:
-            print(f"🔍 Fetching LIVE data for {symbol} from Binance API...")
-            
-            # Ensure symbol is uppercase and clean
-            symbol = symbol.upper().strip()
+            logger.debug("🔍 Fetching LIVE data for %s from Binance API", symbol)
             
-            # Validate symbol format (basic check)
-            if not symbol or len(symbol) < 6:
-                raise Exception(f"Invalid symbol format: {symbol}. Use format like BTCUSDT")
+            self._refresh_valid_symbols()
+            symbol = self._normalize_symbol(symbol)
             
-            # Get current price
-            print(f"📊 Getting current price for {symbol}...")
-            price_data = self.get_ticker_price(symbol)
+            cached = self._get_cached(symbol)
+            if cached is not None:
+                return cached
             
-            # Get 24hr statistics
-            print(f"📈 Getting 24h statistics for {symbol}...")
+            # The 24hr statistics already carry lastPrice, so one call covers both
             stats_data = self.get_ticker_24hr(symbol)
             
-            # Calculate price change percentage as float
-            price_change_percent = float(stats_data.get("priceChangePercent", 0))
-            
-            # Determine trend
-            trend_emoji = "📈" if price_change_percent > 0 else "📉" if price_change_percent < 0 else "➡️"
-            
-            # Format the response
-            response = {
-                "symbol": symbol,
-                "current_price": float(price_data.get("price", 0)),
-                "price_change_24h": float(stats_data.get("priceChange", 0)),
-                "price_change_percent_24h": round(float(stats_data.get("priceChangePercent", 0)), 2),
-                "high_24h": float(stats_data.get("highPrice", 0)),
-                "low_24h": float(stats_data.get("lowPrice", 0)),
-                "volume_24h": float(stats_data.get("volume", 0)),
-                "quote_volume_24h": float(stats_data.get("quoteVolume", 0)),
-                "open_price": float(stats_data.get("openPrice", 0)),
-                "close_price": float(stats_data.get("prevClosePrice", 0)),
-                "bid_price": float(stats_data.get("bidPrice", 0)),
-                "ask_price": float(stats_data.get("askPrice", 0)),
-                "timestamp": stats_data.get("closeTime", int(time.time() * 1000)),
-                "trend": trend_emoji,
-                "data_source": "Binance API",
-                "status": "LIVE",
-                "last_updated": time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())
-            }
-            
-            print(f"✅ Successfully retrieved LIVE data for {symbol}")
-            print(f"💰 Current Price: ${response['current_price']}")
-            print(f"📊 24h Change: {response['price_change_percent_24h']}% {trend_emoji}")
-            
-            return json.dumps(response, indent=2)
+            result = self._format_response(symbol, stats_data)
+            self._set_cached(symbol, result)
+            return result
             
         except Exception as e:
-            error_msg = f"Failed to retrieve live price data for {symbol}: {str(e)}"
-            print(f"❌ {error_msg}")
-            
-            error_response = {
-                "error": True,
-                "message": error_msg,
-                "symbol": symbol,
-                "data_source": "Binance API",
-                "status": "ERROR",
-                "timestamp": int(time.time() * 1000)
-            }
-            
-            return json.dumps(error_response, indent=2)
+            return self._format_error(symbol, e)
     
     async def _arun(self, symbol: str) -> str:
         """
         Async version of the tool.
         
+        Fetches the 24hr statistics over the shared httpx client instead
+        of blocking the event loop. Concurrent calls for the same symbol share
+        a single in-flight request.
+        
         Args:
             symbol: Cryptocurrency trading pair
             
         Returns:
             Formatted price information
         """
-        return self._run(symbol)
+        if httpx is None:
+            return await asyncio.to_thread(self._run, symbol)
+        
+        try:
+            logger.debug("🔍 Fetching LIVE data for %s from Binance API", symbol)
+            
+            await self._arefresh_valid_symbols()
+            symbol = self._normalize_symbol(symbol)
+            
+            cached = self._get_cached(symbol)
+            if cached is not None:
+                return cached
+            
+            inflight = _loop_inflight(self._inflight)
+            future = inflight.get(symbol)
+            if future is None:
+                future = asyncio.ensure_future(self._afetch(symbol))
+                inflight[symbol] = future
+                future.add_done_callback(lambda _: inflight.pop(symbol, None))
+            
+            # Shield so one cancelled caller doesn't cancel the shared fetch
+            return await asyncio.shield(future)
+            
+        except Exception as e:
+            return self._format_error(symbol, e)
+
+
+class BinanceBatchPriceTool(BinancePriceTool):
+    """Tool for retrieving price data for several cryptocurrencies in one Binance request."""
+    
+    name: str = "binance_batch_price"
+    description: str = """
+    Use this tool to get current live prices and market information for SEVERAL cryptocurrencies at once.
+    Input should be a list of symbols like ['BTCUSDT', 'ETHUSDT'].
+    Prefer this over calling binance_price repeatedly when comparing coins.
+    """
+    args_schema: type[BinanceBatchPriceRequest] = BinanceBatchPriceRequest
+    
+    def _format_batch_response(self, stats_list: List[Dict[str, Any]]) -> str:
+        """
+        Build the JSON payload for a batch of symbols.
+        
+        Args:
+            stats_list: Payload array from /api/v3/ticker/24hr?symbols=[...]
+            
+        Returns:
+            Formatted price information as a JSON string
+        """
+        results = [self._build_response(stats["symbol"], stats) for stats in stats_list]
+        return orjson.dumps({
+            "results": results,
+            "total_results": len(results)
+        }, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def _run(self, symbols: List[str]) -> str:
+        """
+        Run the tool to get price information for several symbols.
+        
+        Args:
+            symbols: Cryptocurrency trading pairs (e.g., ["BTCUSDT", "ETHUSDT"])
+            
+        Returns:
+            Formatted price information as a JSON string
+        """
+        try:
+            self._refresh_valid_symbols()
+            symbols = [self._normalize_symbol(s) for s in symbols]
+            logger.debug("🔍 Fetching LIVE data for %d symbols from Binance API", len(symbols))
+            
+            return self._format_batch_response(self.get_ticker_24hr_batch(symbols))
+            
+        except Exception as e:
+            return self._format_error(",".join(symbols), e)
+    
+    async def _arun(self, symbols: List[str]) -> str:
+        """
+        Async version of the tool.
+        
+        Args:
+            symbols: Cryptocurrency trading pairs
+            
+        Returns:
+            Formatted price information
+        """
+        if httpx is None:
+            return await asyncio.to_thread(self._run, symbols)
+        
+        try:
+            await self._arefresh_valid_symbols()
+            symbols = [self._normalize_symbol(s) for s in symbols]
+            logger.debug("🔍 Fetching LIVE data for %d symbols from Binance API", len(symbols))
+            
+            return self._format_batch_response(await self._aget_ticker_24hr_batch(symbols))
+            
+        except Exception as e:
+            return self._format_error(",".join(symbols), e)
+
+
+async def warm_valid_symbols() -> None:
+    """Load the shared tradable symbol list so the first price request doesn't wait on exchangeInfo."""
+    await BinancePriceTool()._arefresh_valid_symbols()
 
 
 # Utility function to test the tool directly
@@ -1,32 +1,44 @@
 """
 Knowledge Base tool for retrieving information from vector databases.
 """
+import functools
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
-import json
+import orjson
 from langchain_core.tools import BaseTool
 
-# Safe imports for vector stores
-try:
-    from langchain_community.vectorstores import Chroma, Qdrant
-except ImportError as e:
-    print(f"Warning: Could not import some vector stores: {e}")
-    Chroma = None
-    Qdrant = None
+from app.config import settings
 
-# Try multiple import paths for Pinecone
-PineconeVectorStore = None
-try:
-    from langchain_pinecone import PineconeVectorStore
-except ImportError:
+@functools.lru_cache(maxsize=None)
+def _load_vector_store_class(store_type: str) -> Any:
+    """
+    Import the LangChain vector store class for a store type on first use.
+    
+    Each backend pulls in heavy dependencies, so only the configured one is imported.
+    
+    Args:
+        store_type: One of chroma, qdrant, pinecone
+        
+    Returns:
+        The vector store class, or None if it is unavailable
+    """
     try:
-        from langchain_community.vectorstores import Pinecone as PineconeVectorStore
-    except ImportError:
-        print("Warning: PineconeVectorStore not available. Install with: pip install langchain-pinecone")
-
-# Import other necessary modules
-from langchain_community.embeddings import HuggingFaceEmbeddings
-from app.config import settings
+        if store_type == "chroma":
+            from langchain_community.vectorstores import Chroma
+            return Chroma
+        if store_type == "qdrant":
+            from langchain_community.vectorstores import Qdrant
+            return Qdrant
+        if store_type == "pinecone":
+            # Try multiple import paths for Pinecone
+            try:
+                from langchain_pinecone import PineconeVectorStore
+            except ImportError:
+                from langchain_community.vectorstores import Pinecone as PineconeVectorStore
+            return PineconeVectorStore
+    except ImportError as e:
+        print(f"Warning: Could not import {store_type} vector store: {e}")
+    return None
 
 class KnowledgeBaseRequest(BaseModel):
     """Schema for knowledge base query parameters."""
@@ -53,34 +65,66 @@ class KnowledgeBaseTool(BaseTool):
     def _initialize_vector_store(self):
         """Initialize the vector store based on configuration."""
         try:
-            embeddings = HuggingFaceEmbeddings(
-                model_name=settings.EMBEDDING_MODEL_NAME
-            )
+            store_type = settings.VECTOR_STORE_TYPE.lower()
+            store_class = _load_vector_store_class(store_type)
+            if store_class is None:
+                print(f"Warning: Vector store type '{settings.VECTOR_STORE_TYPE}' not available or not supported")
+                return None
             
-            if settings.VECTOR_STORE_TYPE.lower() == "chroma" and Chroma:
-                return Chroma(
+            # Imported here so the embedding stack only loads when a store is configured
+            from app.knowledge_base.embeddings import get_embedding_model
+            embeddings = get_embedding_model()
+            
+            if store_type == "chroma":
+                return store_class(
                     persist_directory=settings.CHROMA_PERSIST_DIRECTORY,
                     embedding_function=embeddings
                 )
-            elif settings.VECTOR_STORE_TYPE.lower() == "qdrant" and Qdrant:
-                return Qdrant(
+            elif store_type == "qdrant":
+                return store_class(
                     url=settings.QDRANT_URL,
                     collection_name=settings.QDRANT_COLLECTION_NAME,
                     embeddings=embeddings
                 )
-            elif settings.VECTOR_STORE_TYPE.lower() == "pinecone" and PineconeVectorStore:
-                return PineconeVectorStore(
+            elif store_type == "pinecone":
+                return store_class(
                     index_name=settings.PINECONE_INDEX_NAME,
                     embedding=embeddings
                 )
-            else:
-                print(f"Warning: Vector store type '{settings.VECTOR_STORE_TYPE}' not available or not supported")
-                return None
                 
         except Exception as e:
             print(f"Error initializing vector store: {e}")
             return None
     
+    def _format_results(self, query: str, results: List[Any]) -> str:
+        """
+        Format similarity search results for the agent.
+        
+        Args:
+            query: Search query string
+            results: Documents returned by the vector store
+            
+        Returns:
+            Formatted search results as a string
+        """
+        if not results:
+            return "No relevant information found in the knowledge base."
+        
+        # Format results
+        formatted_results = []
+        for i, doc in enumerate(results, 1):
+            formatted_results.append({
+                "result": i,
+                "content": doc.page_content,
+                "metadata": doc.metadata
+            })
+        
+        return orjson.dumps({
+            "query": query,
+            "results": formatted_results,
+            "total_results": len(formatted_results)
+        }, option=orjson.OPT_INDENT_2).decode()
+    
     def _run(self, query: str, k: Optional[int] = 5) -> str:
         """
         Run the tool to search the knowledge base.
@@ -98,24 +142,30 @@ class KnowledgeBaseTool(BaseTool):
         try:
             # Perform similarity search
             results = self.vector_store.similarity_search(query, k=k)
+            return self._format_results(query, results)
             
-            if not results:
-                return "No relevant information found in the knowledge base."
-            
-            # Format results
-            formatted_results = []
-            for i, doc in enumerate(results, 1):
-                formatted_results.append({
-                    "result": i,
-                    "content": doc.page_content,
-                    "metadata": doc.metadata
-                })
+        except Exception as e:
+            return f"Error searching knowledge base: {str(e)}"
+    
+    async def _arun(self, query: str, k: Optional[int] = 5) -> str:
+        """
+        Async version of the tool.
+        
+        Args:
+            query: Search query string
+            k: Number of results to return
             
-            return json.dumps({
-                "query": query,
-                "results": formatted_results,
-                "total_results": len(formatted_results)
-            }, indent=2)
+        Returns:
+            Formatted search results as a string
+        """
+        if not self.vector_store:
+            return "Knowledge base is not available. Please check the configuration."
+        
+        try:
+            # Stores without a native async search run it in an executor,
+            # so the event loop stays free either way
+            results = await self.vector_store.asimilarity_search(query, k=k)
+            return self._format_results(query, results)
             
         except Exception as e:
-            return f"Error searching knowledge base: {str(e)}"
\ No newline at end of file
+            return f"Error searching knowledge base: {str(e)}"
@@ -2,11 +2,43 @@
 Rejection tool for handling non-crypto trading queries.
 Provides polite rejection responses and redirects to automatealgos.in
 """
+import re
+import random
 from typing import Type
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
 
+# Keyword fragment -> canonical topic; the keyword occurring earliest in the query wins
+_TOPIC_KEYWORDS = {
+    "weather": "weather",
+    "sport": "sports",
+    "politic": "politics",
+    "cook": "cooking",
+    "travel": "travel",
+    "health": "health",
+    "movie": "entertainment",
+    "book": "books",
+    "music": "music",
+    "news": "general news",
+    "science": "science",
+    "history": "history"
+}
+
+# Single C-level scan over the query instead of one substring search per keyword
+_TOPIC_RE = re.compile("|".join(map(re.escape, _TOPIC_KEYWORDS)))
+
+
+# Response templates, each filled with the extracted topic
+_TEMPLATES: tuple[str, ...] = (
+    "🤖 I'm specialized in cryptocurrency trading only!\n\nFor **{topic}** questions, check out:\n🌐 **https://automatealgos.in**\n\nI can help with:\n📈 Crypto prices & market data\n📊 Trading strategies\n📚 Crypto education\n\nWhat crypto trading topic can I assist with? 🚀",
+    
+    "🎯 I focus exclusively on crypto trading assistance!\n\nFor **{topic}** related queries, visit:\n🌐 **https://automatealgos.in**\n\nI'm your go-to for:\n💰 Live crypto prices\n📉 Technical analysis\n⚖️ Risk management\n\nAny crypto trading questions? 📊",
+    
+    "🤖 My expertise is cryptocurrency trading only!\n\nFor **{topic}** information, please see:\n🌐 **https://automatealgos.in**\n\nI can help you with:\n🚀 Market insights\n📈 Trading education  \n💡 Strategy guidance\n\nWhat's your crypto trading question? 💰"
+)
+
+
 class RejectionInput(BaseModel):
     """Input schema for the rejection tool."""
     query: str = Field(description="The user's non-trading query that should be rejected")
@@ -49,44 +81,12 @@ class RejectionTool(BaseTool):
             Formatted rejection message with redirect
         """
         # Extract topic for personalization
-        topic = self._extract_topic(query)
-        
-        responses = [
-            f"🤖 I'm specialized in cryptocurrency trading only!\n\nFor **{topic}** questions, check out:\n🌐 **https://automatealgos.in**\n\nI can help with:\n📈 Crypto prices & market data\n📊 Trading strategies\n📚 Crypto education\n\nWhat crypto trading topic can I assist with? 🚀",
-            
-            f"🎯 I focus exclusively on crypto trading assistance!\n\nFor **{topic}** related queries, visit:\n🌐 **https://automatealgos.in**\n\nI'm your go-to for:\n💰 Live crypto prices\n📉 Technical analysis\n⚖️ Risk management\n\nAny crypto trading questions? 📊",
-            
-            f"🤖 My expertise is cryptocurrency trading only!\n\nFor **{topic}** information, please see:\n🌐 **https://automatealgos.in**\n\nI can help you with:\n🚀 Market insights\n📈 Trading education  \n💡 Strategy guidance\n\nWhat's your crypto trading question? 💰"
-        ]
-        
-        # Select response based on query characteristics
-        selection = hash(query) % len(responses)
-        return responses[selection]
+        return random.choice(_TEMPLATES).format(topic=self._extract_topic(query))
     
     def _extract_topic(self, query: str) -> str:
         """Extract the main topic from the query for personalization."""
-        query_lower = query.lower()
-        
-        topic_keywords = {
-            "weather": "weather",
-            "sport": "sports", 
-            "politic": "politics",
-            "cook": "cooking",
-            "travel": "travel",
-            "health": "health",
-            "movie": "entertainment",
-            "book": "books",
-            "music": "music",
-            "news": "general news",
-            "science": "science",
-            "history": "history"
-        }
-        
-        for keyword, topic in topic_keywords.items():
-            if keyword in query_lower:
-                return topic
-        
-        return "general topics"
+        match = _TOPIC_RE.search(query.lower())
+        return _TOPIC_KEYWORDS[match.group(0)] if match else "general topics"
     
     async def _arun(self, query: str) -> str:
         """Async version of the rejection tool."""
@@ -1,11 +1,32 @@
 """
 Simple crypto trading knowledge tool without embeddings.
 """
-from typing import Type
+import re
+from typing import Final, Type
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
 
+# Returned on every miss, so built once rather than per call
+_DEFAULT_RESPONSE: Final[str] = """📚 **Crypto Trading Basics:**
+
+🎯 **Key Principles:**
+- Start small while learning
+- Use stop losses to manage risk  
+- Don't trade on emotions
+- Study market trends and news
+
+📊 **Popular Indicators:**
+- RSI - momentum indicator
+- MACD - trend changes
+- Support/Resistance levels
+
+⚠️ **Risk Warning:** Crypto trading is risky. Only invest what you can afford to lose."""
+
+# Appended to every term hit
+_DISCLAIMER: Final[str] = "\n\n⚠️ *Educational content only - not financial advice.*"
+
+
 class SimpleKnowledgeInput(BaseModel):
     """Input schema for simple knowledge queries."""
     query: str = Field(description="Crypto trading question")
@@ -33,31 +54,19 @@ class SimpleKnowledgeTool(BaseTool):
             "volatility": "Crypto markets are highly volatile - prices can change rapidly.",
             "risk_management": "Key rules: never invest more than you can afford to lose, use stop losses, diversify."
         }
+        # One compiled scan over the query instead of a substring search per term
+        self._term_re = re.compile("|".join(map(re.escape, self.knowledge)))
     
     def _run(self, query: str) -> str:
         """Get basic trading information."""
-        query_lower = query.lower()
-        
         # Check for specific terms
-        for term, info in self.knowledge.items():
-            if term in query_lower:
-                return f"📚 **{term.upper()}**: {info}\n\n⚠️ *Educational content only - not financial advice.*"
+        match = self._term_re.search(query.lower())
+        if match:
+            term = match.group(0)
+            return f"📚 **{term.upper()}**: {self.knowledge[term]}{_DISCLAIMER}"
         
         # General response
-        return """📚 **Crypto Trading Basics:**
-
-🎯 **Key Principles:**
-- Start small while learning
-- Use stop losses to manage risk  
-- Don't trade on emotions
-- Study market trends and news
-
-📊 **Popular Indicators:**
-- RSI - momentum indicator
-- MACD - trend changes
-- Support/Resistance levels
-
-⚠️ **Risk Warning:** Crypto trading is risky. Only invest what you can afford to lose."""
+        return _DEFAULT_RESPONSE
     
     async def _arun(self, query: str) -> str:
         return self._run(query)
\ No newline at end of file
@@ -2,12 +2,15 @@
 API endpoints for the Crypto AI Agent.
 """
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
 import asyncio
+from cachetools import TTLCache
 
 from app.agent.agent import CryptoAgent
+from app.agent.tools.binance_tool import close_session as close_binance_session
+from app.api import session_store
 from app.api.models import (
     ChatRequest, 
     ChatResponse, 
@@ -16,11 +19,27 @@ from app.api.models import (
     KnowledgeBaseIngestionResponse
 )
 from app.knowledge_base.ingest import ingest_documents
+from app.config import settings
+from app.metrics import CONTENT_TYPE_LATEST, generate_latest
 
 router = APIRouter()
 
-# Store chat sessions
-chat_sessions = {}
+class _AgentCache(TTLCache):
+    """TTLCache that releases an agent's memory when it is evicted or expires."""
+    
+    def popitem(self):
+        key, agent = super().popitem()
+        agent.close()
+        return key, agent
+    
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for _, agent in expired or ():
+            agent.close()
+        return expired
+
+# Store chat sessions; idle sessions expire after SESSION_TTL seconds
+chat_sessions: TTLCache = _AgentCache(maxsize=settings.MAX_SESSIONS, ttl=settings.SESSION_TTL)
 
 def get_agent(session_id: str) -> CryptoAgent:
     """
@@ -32,16 +51,35 @@ def get_agent(session_id: str) -> CryptoAgent:
     Returns:
         A CryptoAgent instance
     """
-    if session_id not in chat_sessions:
-        chat_sessions[session_id] = CryptoAgent()
+    agent = chat_sessions.get(session_id)
+    if agent is None:
+        agent = CryptoAgent()
     
-    return chat_sessions[session_id]
+    # Re-inserting refreshes the session's TTL on every request
+    chat_sessions[session_id] = agent
+    return agent
+
+@router.on_event("shutdown")
+async def shutdown() -> None:
+    """Release shared HTTP and Redis connections when the server stops."""
+    await close_binance_session()
+    await session_store.close()
 
 @router.get("/health", response_model=HealthResponse, tags=["health"])
 async def health_check() -> HealthResponse:
     """Check the health of the API."""
     return {"status": "ok", "version": "1.0.0"}
 
+@router.get("/metrics", tags=["health"])
+async def metrics() -> Response:
+    """Expose Prometheus metrics."""
+    if generate_latest is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Metrics are unavailable. Install with: pip install prometheus-client"
+        )
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
 @router.post("/chat", response_model=ChatResponse, tags=["chat"])
 async def chat(request: ChatRequest) -> ChatResponse:
     """
@@ -57,8 +95,15 @@ async def chat(request: ChatRequest) -> ChatResponse:
         # Get or create agent for the session
         agent = get_agent(request.session_id)
         
+        # Another worker may have handled this session's previous turns
+        history = await session_store.load_history(request.session_id)
+        if history is not None:
+            agent.set_history(request.session_id, history)
+        
         # Process the message
-        response = await agent.process_message(request.message)
+        response = await agent.process_message(request.message, request.session_id)
+        
+        await session_store.save_history(request.session_id, agent.get_history(request.session_id))
         
         return {
             "session_id": request.session_id,
@@ -86,8 +131,8 @@ async def ingest_knowledge_base(request: KnowledgeBaseIngestionRequest, backgrou
     """
     try:
         # Define background task for ingestion
-        def ingest_in_background():
-            num_docs = ingest_documents(
+        async def ingest_in_background():
+            num_docs = await ingest_documents(
                 directory=request.directory,
                 chunk_size=request.chunk_size,
                 chunk_overlap=request.chunk_overlap,
@@ -2,7 +2,7 @@
 Pydantic models for API requests and responses.
 """
 from typing import Dict, Any, Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 import uuid
 
 class ChatRequest(BaseModel):
@@ -32,16 +32,25 @@ class KnowledgeBaseIngestionRequest(BaseModel):
     )
     chunk_size: int = Field(
         1000, 
+        gt=0,
         description="Size of each chunk"
     )
     chunk_overlap: int = Field(
         200, 
+        ge=0,
         description="Overlap between chunks"
     )
     reset: bool = Field(
         False, 
         description="Whether to reset the knowledge base before ingestion"
     )
+    
+    @model_validator(mode="after")
+    def check_overlap(self) -> "KnowledgeBaseIngestionRequest":
+        """Reject geometries the splitter can't honour before ingestion starts in the background."""
+        if self.chunk_overlap >= self.chunk_size:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
+        return self
 
 class KnowledgeBaseIngestionResponse(BaseModel):
     """Knowledge base ingestion response model."""
@@ -0,0 +1,95 @@
+"""
+Redis-backed storage for chat session memory, shared across server workers.
+"""
+import logging
+from typing import List, Optional
+import orjson
+from langchain_core.messages import BaseMessage, messages_from_dict, messages_to_dict
+
+from app.config import settings
+
+# redis is optional; without it session memory stays in each worker process
+try:
+    import redis.asyncio as redis
+    from redis.exceptions import RedisError
+except ImportError:
+    redis = None
+    RedisError = ()
+
+logger = logging.getLogger(__name__)
+
+# Cache the Redis client instance
+_redis_client = None
+
+def get_redis() -> Optional["redis.Redis"]:
+    """
+    Get or create the Redis client if REDIS_URL is configured.
+    
+    Returns:
+        A Redis client, or None when sessions are kept in-process
+    """
+    global _redis_client
+    
+    if _redis_client is None and settings.REDIS_URL:
+        if redis is None:
+            print("Warning: REDIS_URL is set but redis is not installed. Install with: pip install redis")
+            return None
+        _redis_client = redis.from_url(settings.REDIS_URL)
+    
+    return _redis_client
+
+def _session_key(session_id: str) -> str:
+    """Build the Redis key for a session."""
+    return f"sess:{session_id}"
+
+async def load_history(session_id: str) -> Optional[List[BaseMessage]]:
+    """
+    Load a session's chat history from Redis.
+    
+    Args:
+        session_id: The session identifier
+        
+    Returns:
+        The stored messages, or None if Redis is disabled, unreachable or has no entry
+    """
+    client = get_redis()
+    if client is None:
+        return None
+    
+    try:
+        blob = await client.get(_session_key(session_id))
+    except RedisError as e:
+        # Fall back to the worker's local history rather than failing the chat
+        logger.warning("Could not load session %s from Redis: %s", session_id, e)
+        return None
+    if blob is None:
+        return None
+    
+    return messages_from_dict(orjson.loads(blob))
+
+async def save_history(session_id: str, messages: List[BaseMessage]) -> None:
+    """
+    Store a session's chat history in Redis, refreshing its TTL.
+    
+    The save is skipped (and the history kept only in this worker) if Redis is unreachable.
+    
+    Args:
+        session_id: The session identifier
+        messages: The session's chat history
+    """
+    client = get_redis()
+    if client is None:
+        return
+    
+    try:
+        await client.setex(_session_key(session_id), settings.SESSION_TTL, orjson.dumps(messages_to_dict(messages)))
+    except RedisError as e:
+        logger.warning("Could not save session %s to Redis: %s", session_id, e)
+
+async def close() -> None:
+    """Close the Redis client, if one was opened."""
+    global _redis_client
+    
+    if _redis_client is not None:
+        await _redis_client.aclose()
+    _redis_client = None
@@ -2,6 +2,7 @@
 Configuration settings for the Crypto AI Agent application.
 """
 import os
+from functools import cached_property, lru_cache
 from typing import Optional
 try:
     from pydantic_settings import BaseSettings
@@ -23,21 +24,33 @@ class Settings(BaseSettings):
     # Binance API Settings
     BINANCE_API_KEY: Optional[str] = None
     BINANCE_API_SECRET: Optional[str] = None
+    BINANCE_BATCH_WINDOW_MS: int = 30  # Window for coalescing concurrent ticker lookups (0 disables)
     
     # Vector Database Settings
     VECTOR_DB_TYPE: str = "chroma"  # Options: chroma, qdrant, pinecone
     VECTOR_DB_URL: Optional[str] = None
     VECTOR_DB_API_KEY: Optional[str] = None
     VECTOR_DB_COLLECTION: str = "crypto_knowledge"
+    QDRANT_UPLOAD_BATCH_SIZE: int = 512
+    QDRANT_UPLOAD_PARALLEL: Optional[int] = None  # Upload workers (defaults to half the CPU count)
     
     # Embedding Model Settings
     EMBEDDING_MODEL: str = "sentence-transformers/all-MiniLM-L6-v2"
+    EMBEDDING_BACKEND: str = "huggingface"  # Options: huggingface, infinity
+    INFINITY_URL: Optional[str] = None  # Base URL of an Infinity embedding server
+    EMBEDDING_COMPILE: bool = False  # torch.compile the embedding model on CUDA (slower startup, faster encode)
     
     # Knowledge Base Settings
     KB_DATA_DIR: str = "./data/knowledge_base"
+    KB_INGEST_WORKERS: Optional[int] = None  # Processes used to parse files (defaults to CPU count - 1)
+    WARMUP_ON_STARTUP: bool = True  # Preload the embedding model and vector store at boot; disable in tests
+    PRELOAD_MODELS: bool = False  # Load the embedding model at import, for gunicorn --preload
     
     # Memory Settings
     MEMORY_WINDOW: int = 10
+    MAX_SESSIONS: int = 1000
+    SESSION_TTL: int = 1800  # Seconds of inactivity before a session's memory is evicted
+    REDIS_URL: Optional[str] = None  # Share session memory across workers when set
     
     # Additional settings that might be needed by your application
     LLM_TEMPERATURE: float = 0.1
@@ -49,38 +62,39 @@ class Settings(BaseSettings):
     # Chroma Configuration
     CHROMA_PERSIST_DIRECTORY: str = "./data/chroma_db"
     
-    # Properties for backward compatibility with other parts of your code
-    @property
+    # Aliases for backward compatibility with other parts of your code.
+    # Cached on first access; the model is frozen so they can't go stale.
+    @cached_property
     def LLM_MODEL_NAME(self) -> str:
         """Alias for KIMI2_MODEL for backward compatibility."""
         return self.KIMI2_MODEL
     
-    @property
+    @cached_property
     def VECTOR_STORE_TYPE(self) -> str:
         """Alias for VECTOR_DB_TYPE for backward compatibility."""
         return self.VECTOR_DB_TYPE
     
-    @property
+    @cached_property
     def EMBEDDING_MODEL_NAME(self) -> str:
         """Alias for EMBEDDING_MODEL for backward compatibility."""
         return self.EMBEDDING_MODEL
     
-    @property
+    @cached_property
     def QDRANT_COLLECTION_NAME(self) -> str:
         """Alias for VECTOR_DB_COLLECTION for backward compatibility."""
         return self.VECTOR_DB_COLLECTION
     
-    @property
+    @cached_property
     def KNOWLEDGE_BASE_PATH(self) -> str:
         """Alias for KB_DATA_DIR for backward compatibility."""
         return self.KB_DATA_DIR
     
-    @property
+    @cached_property
     def QDRANT_URL(self) -> Optional[str]:
         """Alias for VECTOR_DB_URL when using Qdrant."""
         return self.VECTOR_DB_URL if self.VECTOR_DB_TYPE.lower() == "qdrant" else None
     
-    @property
+    @cached_property
     def PINECONE_API_KEY(self) -> Optional[str]:
         """Alias for VECTOR_DB_API_KEY when using Pinecone."""
         return self.VECTOR_DB_API_KEY if self.VECTOR_DB_TYPE.lower() == "pinecone" else None
@@ -90,6 +104,17 @@ class Settings(BaseSettings):
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = True
+        frozen = True
 
-# Create a global settings instance
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, parsing the environment only once.
+    
+    Returns:
+        The shared Settings instance
+    """
+    return Settings()
+
+# Global settings instance
+settings = get_settings()
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+Numeric helpers for embedding vectors.
+"""
+import math
+import numpy as np
+
+# numba is optional; without it normalization falls back to vectorized numpy
+try:
+    from numba import njit, prange
+except ImportError:
+    print("Warning: numba not available, normalizing embeddings with numpy. Install with: pip install numba")
+    njit = None
+
+# Guards against division by zero for all-zero vectors
+_EPS = 1e-12
+
+if njit is not None:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _normalize_2d_jit(x):
+        for i in prange(x.shape[0]):
+            norm = 0.0
+            for j in range(x.shape[1]):
+                norm += x[i, j] * x[i, j]
+            norm = math.sqrt(norm) + _EPS
+            for j in range(x.shape[1]):
+                x[i, j] /= norm
+        return x
+
+def normalize_2d(x: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize each row of a matrix in place.
+    
+    Args:
+        x: Float matrix with one embedding per row
+        
+    Returns:
+        The same array, with every row scaled to unit length
+    """
+    if njit is not None:
+        return _normalize_2d_jit(x)
+    
+    x /= np.linalg.norm(x, axis=1, keepdims=True) + _EPS
+    return x
@@ -1,12 +1,42 @@
 """
 Embedding model setup for the knowledge base vector database.
 """
-from typing import Any
+import threading
+from typing import Any, Tuple
 from langchain_community.embeddings import HuggingFaceEmbeddings
 from app.config import settings
 
 # Cache the embedding model instance
 _embedding_model_instance = None
+_embedding_model_lock = threading.Lock()
+
+def _select_device_and_dtype() -> Tuple[str, Any]:
+    """
+    Pick the device and weight precision for the embedding model.
+    
+    Uses float16 on CUDA and bfloat16 on CPUs with native BF16 support
+    (AVX-512-BF16/AMX); otherwise keeps float32 on CPU.
+    
+    Returns:
+        Tuple of (device, torch dtype or None for the model default)
+    """
+    try:
+        import torch
+    except ImportError:
+        return "cpu", None
+    
+    if torch.cuda.is_available():
+        return "cuda", torch.float16
+    
+    # Private torch helper; absent or failing on some builds, so fall back to float32
+    is_bf16_supported = getattr(getattr(torch, "cpu", None), "_is_avx512_bf16_supported", None)
+    try:
+        if is_bf16_supported is not None and is_bf16_supported():
+            return "cpu", torch.bfloat16
+    except Exception:
+        pass
+    
+    return "cpu", None
 
 def get_embedding_model() -> Any:
     """
@@ -20,11 +50,77 @@ def get_embedding_model() -> Any:
     if _embedding_model_instance is not None:
         return _embedding_model_instance
     
+    # Serialize first loads so concurrent callers never load the model twice
+    with _embedding_model_lock:
+        if _embedding_model_instance is None:
+            _embedding_model_instance = _load_embedding_model()
+    
+    return _embedding_model_instance
+
+def _load_embedding_model() -> Any:
+    """
+    Build the configured embedding model.
+    
+    Returns:
+        A ready-to-use embedding model
+    """
+    if settings.EMBEDDING_BACKEND.lower() == "infinity":
+        # Infinity batches dynamically and runs fp16 inference server-side
+        from langchain_community.embeddings import InfinityEmbeddings
+        
+        if not settings.INFINITY_URL:
+            raise ValueError("INFINITY_URL must be set when EMBEDDING_BACKEND is 'infinity'")
+        
+        return InfinityEmbeddings(
+            model=settings.EMBEDDING_MODEL,
+            infinity_api_url=settings.INFINITY_URL
+        )
+    
+    device, dtype = _select_device_and_dtype()
+    model_kwargs = {"device": device}
+    if dtype is not None:
+        # Forwarded by SentenceTransformer (>=3.0) to the underlying transformers model
+        model_kwargs["model_kwargs"] = {"torch_dtype": dtype}
+    
     # Initialize the embedding model
-    _embedding_model_instance = HuggingFaceEmbeddings(
+    model = HuggingFaceEmbeddings(
         model_name=settings.EMBEDDING_MODEL,
-        model_kwargs={"device": "cpu"},  # Use GPU if available by changing to "cuda"
-        encode_kwargs={"normalize_embeddings": True}
+        model_kwargs=model_kwargs,
+        encode_kwargs={
+            "batch_size": 128 if device == "cuda" else 64,
+            "normalize_embeddings": True,
+            "convert_to_numpy": True
+        }
     )
+    if device == "cuda" and settings.EMBEDDING_COMPILE:
+        _compile_model(model)
+    # Also triggers compilation, so the first real batch doesn't pay for it
+    warmup(model)
     
-    return _embedding_model_instance
\ No newline at end of file
+    return model
+
+def _compile_model(model: Any) -> None:
+    """
+    Compile the transformer behind a HuggingFaceEmbeddings instance with torch.compile.
+    
+    Args:
+        model: A HuggingFaceEmbeddings instance
+    """
+    import torch
+    
+    if not hasattr(torch, "compile"):
+        print("Warning: torch.compile requires torch>=2.0, running the embedding model eagerly")
+        return
+    
+    # dynamic=True avoids a recompile for every new batch/sequence length
+    first_module = model.client._first_module()
+    first_module.auto_model = torch.compile(first_module.auto_model, dynamic=True)
+
+def warmup(model: Any) -> None:
+    """
+    Run one throwaway forward pass so tokenizer and kernel caches are hot.
+    
+    Args:
+        model: A HuggingFaceEmbeddings instance
+    """
+    model.client.encode(["warmup"], batch_size=1, show_progress_bar=False)
@@ -2,18 +2,138 @@
 Utilities for ingesting knowledge base content into the vector database.
 """
 import os
-import glob
-from typing import List, Dict, Any, Optional
+import mmap
+import asyncio
+import functools
+import itertools
+import multiprocessing
+from typing import Callable, Iterable, Iterator, List, Dict, Any, Optional
+import orjson
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_community.document_loaders import (
     TextLoader, 
     CSVLoader, 
-    UnstructuredMarkdownLoader,
-    JSONLoader
+    UnstructuredMarkdownLoader
 )
 from app.config import settings
-from app.knowledge_base.vector_store import add_documents, delete_collection
+from app.knowledge_base.vector_store import add_documents, persist_vector_store, reset_collection
+
+# The Rust-backed splitter is optional; without it chunking stays in pure Python
+try:
+    from semantic_text_splitter import TextSplitter
+except ImportError:
+    print("Warning: semantic-text-splitter not available, using the LangChain splitter. Install with: pip install semantic-text-splitter")
+    TextSplitter = None
+
+def _json_text(item: Any) -> str:
+    """
+    Render one JSON element as document text, the way JSONLoader does.
+    
+    Args:
+        item: Parsed JSON element
+        
+    Returns:
+        Strings unchanged, non-empty containers as JSON, other scalars via str(),
+        and empty containers or null as ""
+    """
+    if isinstance(item, str):
+        return item
+    if isinstance(item, (dict, list)):
+        return orjson.dumps(item).decode() if item else ""
+    return str(item) if item is not None else ""
+
+def _load_json(file_path: str) -> List[Document]:
+    """
+    Load a JSON file with one document per top-level element.
+    
+    Equivalent to JSONLoader with jq_schema='.[]', but parsed by orjson
+    straight from a memory map instead of through a jq program.
+    
+    Args:
+        file_path: Path to the JSON file
+        
+    Returns:
+        List of documents, one per array element (or object value)
+    """
+    if os.path.getsize(file_path) == 0:
+        return []
+    
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            data = orjson.loads(view)
+    
+    items = data.values() if isinstance(data, dict) else data
+    return [
+        Document(page_content=_json_text(item), metadata={"source": file_path, "seq_num": i})
+        for i, item in enumerate(items, start=1)
+    ]
+
+def load_single_document(file_path: str) -> List[Document]:
+    """
+    Load a single file with the loader matching its extension.
+    
+    Args:
+        file_path: Path to the file to load
+        
+    Returns:
+        List of documents produced by the loader
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    
+    if ext == ".txt":
+        loader = TextLoader(file_path, encoding="utf-8")
+    elif ext == ".md":
+        loader = UnstructuredMarkdownLoader(file_path, encoding="utf-8")
+    elif ext == ".csv":
+        loader = CSVLoader(file_path)
+    elif ext == ".json":
+        return _load_json(file_path)
+    else:
+        raise ValueError(f"Unsupported file type: {file_path}")
+    
+    return loader.load()
+
+def iter_documents(directory: str) -> Iterator[Document]:
+    """
+    Stream documents from a directory, one at a time.
+    
+    Parsing is CPU-bound, so files are spread across a process pool sized by
+    KB_INGEST_WORKERS (defaults to one less than the CPU count). Results are
+    yielded as each file finishes, in walk order.
+    
+    Args:
+        directory: Directory path containing documents
+        
+    Yields:
+        Loaded documents
+    """
+    # One walk over the tree, bucketed by extension to keep the per-type load order
+    buckets = {".txt": [], ".md": [], ".csv": [], ".json": []}
+    for root, _, files in os.walk(directory):
+        for name in files:
+            bucket = buckets.get(os.path.splitext(name)[1].lower())
+            if bucket is not None:
+                bucket.append(os.path.join(root, name))
+    
+    all_files = list(itertools.chain.from_iterable(buckets.values()))
+    
+    if not all_files:
+        return
+    
+    workers = settings.KB_INGEST_WORKERS or max(1, (os.cpu_count() or 1) - 1)
+    workers = min(workers, len(all_files))
+    if workers == 1:
+        # Not worth forking for a single file or a single core
+        for docs in map(load_single_document, all_files):
+            yield from docs
+        return
+    
+    # Spawn rather than fork: the API process is multithreaded (event loop,
+    # to_thread workers, torch/tokenizer threads), and forking it can deadlock
+    with multiprocessing.get_context("spawn").Pool(workers) as pool:
+        for docs in pool.imap(load_single_document, all_files):
+            yield from docs
 
 def load_documents(directory: str) -> List[Document]:
     """
@@ -25,65 +145,150 @@ def load_documents(directory: str) -> List[Document]:
     Returns:
         List of loaded documents
     """
-    documents = []
-    
-    # Process text files
-    for file_path in glob.glob(os.path.join(directory, "**/*.txt"), recursive=True):
-        loader = TextLoader(file_path, encoding="utf-8")
-        documents.extend(loader.load())
+    return list(iter_documents(directory))
+
+def _resplit_oversize(documents: List[Document], max_size: int) -> List[Document]:
+    """
+    Hard-split any chunk the splitter left longer than max_size.
     
-    # Process Markdown files
-    for file_path in glob.glob(os.path.join(directory, "**/*.md"), recursive=True):
-        loader = UnstructuredMarkdownLoader(file_path, encoding="utf-8")
-        documents.extend(loader.load())
+    The splitter only emits oversized chunks when it found no separator to
+    cut on, so running it again would return the same chunk; these are cut
+    into consecutive max_size character windows instead.
     
-    # Process CSV files
-    for file_path in glob.glob(os.path.join(directory, "**/*.csv"), recursive=True):
-        loader = CSVLoader(file_path)
-        documents.extend(loader.load())
-    
-    # Process JSON files
-    for file_path in glob.glob(os.path.join(directory, "**/*.json"), recursive=True):
-        # The jq_schema specifies how to extract content from JSON
-        loader = JSONLoader(
-            file_path,
-            jq_schema='.[]',  # Modify this based on your JSON structure
-            text_content=False
+    Args:
+        documents: Chunks to check
+        max_size: Largest chunk length kept as-is
+        
+    Returns:
+        Chunks no longer than max_size
+    """
+    result = []
+    for doc in documents:
+        text = doc.page_content
+        if len(text) <= max_size:
+            result.append(doc)
+            continue
+        result.extend(
+            Document(page_content=text[start:start + max_size], metadata=dict(doc.metadata))
+            for start in range(0, len(text), max_size)
         )
-        documents.extend(loader.load())
     
-    return documents
+    return result
 
-def split_documents(documents: List[Document], chunk_size: int = 1000, chunk_overlap: int = 200) -> List[Document]:
+def _merge_tiny(documents: List[Document], min_size: int, max_size: int) -> List[Document]:
     """
-    Split documents into smaller chunks for better embedding.
+    Greedily merge tiny chunks into their neighbour from the same source.
+    
+    A single linear pass: each chunk is folded into the previous one when
+    either is shorter than min_size and the result stays within max_size.
+    
+    Args:
+        documents: Chunks in document order
+        min_size: Chunks shorter than this are merge candidates
+        max_size: Largest allowed merged chunk length
+        
+    Returns:
+        Chunks with context-poor fragments folded into their neighbours
+    """
+    merged = []
+    for doc in documents:
+        if merged:
+            prev = merged[-1]
+            prev_len, doc_len = len(prev.page_content), len(doc.page_content)
+            if (prev.metadata == doc.metadata
+                    and min(prev_len, doc_len) < min_size
+                    and prev_len + doc_len + 1 <= max_size):
+                merged[-1] = Document(page_content=f"{prev.page_content}\n{doc.page_content}", metadata=prev.metadata)
+                continue
+        merged.append(doc)
+    
+    return merged
+
+@functools.lru_cache(maxsize=8)
+def _make_split_text(chunk_size: int, chunk_overlap: int) -> Callable[[str], List[str]]:
+    """
+    Build the text splitting function for the given chunk geometry.
+    
+    Cached so every ingest with the same geometry reuses one splitter
+    instead of rebuilding it (and any tokenizer it holds) per call.
     
     Args:
-        documents: List of documents to split
         chunk_size: Size of each chunk
         chunk_overlap: Overlap between chunks
         
     Returns:
-        List of split documents
+        Function splitting a string into chunk strings
     """
+    if TextSplitter is not None:
+        # Recursion over the separator cascade runs in native code
+        # The lower capacity bound must exceed the overlap, or TextSplitter rejects
+        # geometries (overlap >= chunk_size / 2) the LangChain splitter accepts
+        min_capacity = min(chunk_size, max(chunk_overlap + 1, chunk_size - chunk_overlap))
+        text_splitter = TextSplitter((min_capacity, chunk_size), overlap=chunk_overlap)
+        return text_splitter.chunks
+    
     text_splitter = RecursiveCharacterTextSplitter(
         chunk_size=chunk_size,
         chunk_overlap=chunk_overlap,
         length_function=len,
         is_separator_regex=False,
     )
+    return text_splitter.split_text
+
+def iter_split_documents(documents: Iterable[Document], chunk_size: int = 1000, chunk_overlap: int = 200, min_chunk_size: int = 100) -> Iterator[Document]:
+    """
+    Stream chunks for each document as it arrives.
     
-    return text_splitter.split_documents(documents)
+    Oversized chunks are split again and tiny fragments are merged into a
+    neighbour, so every chunk carries enough context to be worth a
+    retrieval slot and an embedding pass.
+    
+    Args:
+        documents: Documents to split
+        chunk_size: Size of each chunk
+        chunk_overlap: Overlap between chunks
+        min_chunk_size: Chunks shorter than this are merged into a neighbour
+        
+    Yields:
+        Split documents
+    """
+    split_text = _make_split_text(chunk_size, chunk_overlap)
+    
+    for doc in documents:
+        chunks = [Document(page_content=text, metadata=dict(doc.metadata)) for text in split_text(doc.page_content)]
+        
+        # Re-split before merging so the merge pass's output isn't split up again
+        chunks = _resplit_oversize(chunks, max_size=int(chunk_size * 1.1))
+        yield from _merge_tiny(chunks, min_size=min_chunk_size, max_size=int(chunk_size * 1.15))
+
+def split_documents(documents: List[Document], chunk_size: int = 1000, chunk_overlap: int = 200, min_chunk_size: int = 100) -> List[Document]:
+    """
+    Split documents into smaller chunks for better embedding.
+    
+    Args:
+        documents: List of documents to split
+        chunk_size: Size of each chunk
+        chunk_overlap: Overlap between chunks
+        min_chunk_size: Chunks shorter than this are merged into a neighbour
+        
+    Returns:
+        List of split documents
+    """
+    return list(iter_split_documents(documents, chunk_size, chunk_overlap, min_chunk_size))
 
-def ingest_documents(directory: str = None, chunk_size: int = 1000, chunk_overlap: int = 200, reset: bool = False) -> int:
+async def ingest_documents(directory: str = None, chunk_size: int = 1000, chunk_overlap: int = 200, reset: bool = False, batch_size: int = 512) -> int:
     """
     Ingest documents into the vector store.
     
+    Documents are streamed through loading, splitting, embedding and
+    insertion, and the store is persisted once at the end.
+    
     Args:
         directory: Directory containing documents (defaults to KB_DATA_DIR)
         chunk_size: Size of each chunk
         chunk_overlap: Overlap between chunks
         reset: Whether to reset the vector store before ingestion
+        batch_size: Number of chunks inserted per vector store call
         
     Returns:
         Number of documents ingested
@@ -92,19 +297,17 @@ def ingest_documents(directory: str = None, chunk_size: int = 1000, chunk_overla
     
     # Reset the vector store if requested
     if reset:
-        delete_collection()
+        await asyncio.to_thread(reset_collection)
     
-    # Load documents
-    documents = load_documents(directory)
+    # Stream load -> split -> embed -> insert so memory stays flat whatever the corpus size
+    chunks = iter_split_documents(iter_documents(directory), chunk_size, chunk_overlap)
+    num_chunks = await add_documents(chunks, batch_size=batch_size)
     
-    if not documents:
+    if not num_chunks:
         print(f"No documents found in {directory}")
         return 0
     
-    # Split documents
-    split_docs = split_documents(documents, chunk_size, chunk_overlap)
-    
-    # Add documents to vector store
-    add_documents(split_docs)
+    # Persist exactly once, after every batch is in
+    await asyncio.to_thread(persist_vector_store)
     
-    return len(split_docs)
\ No newline at end of file
+    return num_chunks
\ No newline at end of file
@@ -1,18 +1,74 @@
 """
 Vector database integration for storing and retrieving knowledge base content.
 """
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Set, Union, Iterable, Iterator
 import os
+import uuid
+import hashlib
+import asyncio
+import itertools
+from urllib.parse import urlparse
+import numpy as np
 from langchain_core.documents import Document
 from langchain_core.vectorstores import VectorStore
 from langchain_community.vectorstores import Chroma, Qdrant
 from langchain_community.embeddings import HuggingFaceEmbeddings
 from app.config import settings
 from app.knowledge_base.embeddings import get_embedding_model
+from app.knowledge_base._math import normalize_2d
 
 # Cache the vector store instance
 _vector_store_instance = None
 
+# HNSW settings for a freshly recreated Chroma collection (see reset_collection);
+# large sync/batch thresholds make the bulk ingest flush index segments far less often
+_CHROMA_HNSW_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:construction_ef": 200,
+    "hnsw:M": 32,
+    "hnsw:batch_size": 5000,
+    "hnsw:sync_threshold": 100000,
+}
+
+def _create_chroma(embedding_model: Any, collection_metadata: Optional[Dict[str, Any]] = None) -> VectorStore:
+    """
+    Open the configured Chroma collection, on a server or in the local persist directory.
+    
+    Args:
+        embedding_model: Embedding function for queries
+        collection_metadata: Metadata applied if the collection is created by this call
+        
+    Returns:
+        A Chroma vector store
+    """
+    if settings.VECTOR_DB_URL:
+        # A shared Chroma server: no per-process index load, and many writers at once
+        import chromadb
+        
+        url = urlparse(settings.VECTOR_DB_URL)
+        client = chromadb.HttpClient(
+            host=url.hostname,
+            port=url.port or (443 if url.scheme == "https" else 8000),
+            ssl=url.scheme == "https"
+        )
+        return Chroma(
+            client=client,
+            embedding_function=embedding_model,
+            collection_name=settings.VECTOR_DB_COLLECTION,
+            collection_metadata=collection_metadata
+        )
+    
+    # Create the persist directory if it doesn't exist
+    persist_directory = os.path.join(settings.KB_DATA_DIR, "chroma")
+    os.makedirs(persist_directory, exist_ok=True)
+    
+    return Chroma(
+        persist_directory=persist_directory,
+        embedding_function=embedding_model,
+        collection_name=settings.VECTOR_DB_COLLECTION,
+        collection_metadata=collection_metadata
+    )
+
 def get_vector_store() -> VectorStore:
     """
     Get or create the vector store instance based on configuration.
@@ -30,15 +86,7 @@ def get_vector_store() -> VectorStore:
     
     # Initialize the appropriate vector store based on configuration
     if settings.VECTOR_DB_TYPE.lower() == "chroma":
-        # Create the persist directory if it doesn't exist
-        persist_directory = os.path.join(settings.KB_DATA_DIR, "chroma")
-        os.makedirs(persist_directory, exist_ok=True)
-        
-        _vector_store_instance = Chroma(
-            persist_directory=persist_directory,
-            embedding_function=embedding_model,
-            collection_name=settings.VECTOR_DB_COLLECTION
-        )
+        _vector_store_instance = _create_chroma(embedding_model)
     
     elif settings.VECTOR_DB_TYPE.lower() == "qdrant":
         import qdrant_client
@@ -78,39 +126,219 @@ def get_vector_store() -> VectorStore:
     
     return _vector_store_instance
 
-def add_documents(documents: List[Document]) -> None:
+def _iter_batches(documents: Iterable[Document], batch_size: int) -> Iterator[List[Document]]:
+    """
+    Group a document stream into lists of at most batch_size.
+    
+    Args:
+        documents: Documents to group
+        batch_size: Maximum batch length
+        
+    Yields:
+        Consecutive batches of documents
+    """
+    iterator = iter(documents)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        yield batch
+
+class _Batch:
+    """
+    A staged insert batch held as parallel columns rather than Document objects.
+    
+    Embeddings stay in one contiguous array while queued and are only turned
+    into Python lists at the moment a client needs them.
+    """
+    __slots__ = ("ids", "texts", "metadatas", "embeddings")
+    
+    def __init__(self, ids: List[str], texts: List[str], metadatas: List[Dict[str, Any]], embeddings: np.ndarray):
+        self.ids = ids
+        self.texts = texts
+        self.metadatas = metadatas
+        self.embeddings = embeddings
+
+def _chunk_id(doc: Document) -> str:
+    """Deterministic id for a chunk, so identical text always maps to the same record."""
+    return hashlib.sha256(doc.page_content.encode("utf-8")).hexdigest()[:32]
+
+def _existing_ids_chroma(vector_store: VectorStore, ids: List[str]) -> Set[str]:
+    """Return the subset of ids already stored in the Chroma collection."""
+    return set(vector_store._collection.get(ids=ids, include=[])["ids"])
+
+def _insert_chroma(vector_store: VectorStore, batch: _Batch) -> None:
+    """Write a pre-embedded batch directly to the Chroma collection."""
+    # Upsert so a chunk racing in from an earlier in-flight batch is not an error
+    vector_store._collection.upsert(
+        ids=batch.ids,
+        documents=batch.texts,
+        embeddings=batch.embeddings.tolist(),
+        metadatas=batch.metadatas
+    )
+
+def _existing_ids_qdrant(vector_store: VectorStore, ids: List[str]) -> Set[str]:
+    """Return the subset of ids already stored in the Qdrant collection."""
+    client = vector_store.client
+    if not client.collection_exists(settings.VECTOR_DB_COLLECTION):
+        return set()
+    
+    # Qdrant reports ids in canonical UUID form
+    points = client.retrieve(
+        collection_name=settings.VECTOR_DB_COLLECTION,
+        ids=[str(uuid.UUID(point_id)) for point_id in ids],
+        with_payload=False,
+        with_vectors=False
+    )
+    return {uuid.UUID(str(point.id)).hex for point in points}
+
+def _insert_qdrant(vector_store: VectorStore, batch: _Batch) -> None:
+    """Upload a pre-embedded batch to Qdrant with parallel batch workers."""
+    from qdrant_client import models
+    
+    client = vector_store.client
+    if not client.collection_exists(settings.VECTOR_DB_COLLECTION):
+        client.create_collection(
+            collection_name=settings.VECTOR_DB_COLLECTION,
+            vectors_config=models.VectorParams(size=batch.embeddings.shape[1], distance=models.Distance.COSINE, on_disk=True)
+        )
+    
+    # Payload keys match the LangChain wrapper so similarity_search can read the points back
+    points = [
+        models.PointStruct(
+            id=str(uuid.UUID(point_id)),
+            vector=vector,
+            payload={vector_store.content_payload_key: text, vector_store.metadata_payload_key: metadata}
+        )
+        for point_id, text, metadata, vector in zip(batch.ids, batch.texts, batch.metadatas, batch.embeddings.tolist())
+    ]
+    client.upload_points(
+        collection_name=settings.VECTOR_DB_COLLECTION,
+        points=points,
+        batch_size=settings.QDRANT_UPLOAD_BATCH_SIZE,
+        parallel=settings.QDRANT_UPLOAD_PARALLEL or max(1, (os.cpu_count() or 1) // 2),
+        wait=False
+    )
+
+async def add_documents(documents: Iterable[Document], batch_size: int = 512) -> int:
     """
     Add documents to the vector store.
     
+    Documents are embedded and inserted in bounded batches so neither memory
+    nor per-call latency grows with the size of the corpus. For Chroma and
+    Qdrant the next batch is embedded while the previous one is written
+    straight to the collection, so ingest time tends towards the slower of
+    the two stages rather than their sum. Chunks are keyed by a SHA-256 of
+    their text, and chunks already in the store are skipped before embedding,
+    so re-ingesting a mostly unchanged corpus only embeds what changed.
+    
+    Nothing is persisted here; callers persist once after their final batch
+    (see persist_vector_store), since each Chroma persist rewrites the store.
+    
+    The input may be a lazy stream; it is pulled one batch at a time in a
+    worker thread, so upstream loading and splitting never block the loop.
+    
     Args:
-        documents: List of documents to add
+        documents: Documents to add, as a list or a lazy iterable
+        batch_size: Maximum number of documents per insert call
+        
+    Returns:
+        Number of documents processed, including ones already stored
     """
     vector_store = get_vector_store()
-    vector_store.add_documents(documents)
+    batches = _iter_batches(documents, batch_size)
+    count = 0
     
-    # Persist if using Chroma
-    if settings.VECTOR_DB_TYPE.lower() == "chroma":
-        vector_store.persist()
+    async def next_batch() -> Optional[List[Document]]:
+        nonlocal count
+        batch = await asyncio.to_thread(next, batches, None)
+        if batch is not None:
+            count += len(batch)
+        return batch
+    
+    store_type = settings.VECTOR_DB_TYPE.lower()
+    if store_type == "chroma":
+        existing_ids, insert = _existing_ids_chroma, _insert_chroma
+    elif store_type == "qdrant":
+        existing_ids, insert = _existing_ids_qdrant, _insert_qdrant
+    else:
+        while (batch := await next_batch()) is not None:
+            await vector_store.aadd_documents(batch)
+        return count
+    
+    embedding_model = get_embedding_model()
+    # Holds at most two embedded batches ahead of the writer
+    queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+    
+    def embed(texts: List[str]) -> np.ndarray:
+        # Normalize here so cosine distance holds whatever backend produced the vectors
+        embeddings = np.asarray(embedding_model.embed_documents(texts), dtype=np.float32)
+        return normalize_2d(embeddings)
+    
+    async def embed_batches() -> None:
+        try:
+            while (batch := await next_batch()) is not None:
+                # Drop repeats within the batch, then anything the store already holds
+                unique = {_chunk_id(doc): doc for doc in batch}
+                stored = await asyncio.to_thread(existing_ids, vector_store, list(unique))
+                new = {chunk_id: doc for chunk_id, doc in unique.items() if chunk_id not in stored}
+                if not new:
+                    continue
+                
+                texts = [doc.page_content for doc in new.values()]
+                embeddings = await asyncio.to_thread(embed, texts)
+                await queue.put(_Batch(list(new), texts, [doc.metadata for doc in new.values()], embeddings))
+        finally:
+            # Always release the writer, even if embedding failed
+            await queue.put(None)
+    
+    async def insert_batches() -> None:
+        while (batch := await queue.get()) is not None:
+            await asyncio.to_thread(insert, vector_store, batch)
+    
+    producer = asyncio.create_task(embed_batches())
+    try:
+        await insert_batches()
+        await producer
+    finally:
+        producer.cancel()
+    
+    return count
+
+def persist_vector_store() -> None:
+    """Flush the vector store to disk if the backend needs it (local Chroma only)."""
+    if settings.VECTOR_DB_TYPE.lower() == "chroma" and not settings.VECTOR_DB_URL:
+        get_vector_store().persist()
 
 def delete_collection() -> None:
     """Delete the entire collection from the vector store."""
     global _vector_store_instance
     
-    if settings.VECTOR_DB_TYPE.lower() == "chroma":
+    if settings.VECTOR_DB_TYPE.lower() == "chroma" and settings.VECTOR_DB_URL:
+        get_vector_store().delete_collection()
+    
+    elif settings.VECTOR_DB_TYPE.lower() == "chroma":
+        import gc
         import shutil
+        
+        # Drop our handle and collect it so open index files are released before removal
+        _vector_store_instance = None
+        gc.collect()
+        
         persist_directory = os.path.join(settings.KB_DATA_DIR, "chroma")
         if os.path.exists(persist_directory):
             shutil.rmtree(persist_directory)
     
     elif settings.VECTOR_DB_TYPE.lower() == "qdrant":
-        import qdrant_client
-        
-        # Connect to Qdrant
-        if settings.VECTOR_DB_URL:
-            client = qdrant_client.QdrantClient(url=settings.VECTOR_DB_URL, api_key=settings.VECTOR_DB_API_KEY)
+        if _vector_store_instance is not None:
+            # Reuse the live connection instead of a fresh handshake just to delete
+            client = _vector_store_instance.client
         else:
-            local_path = os.path.join(settings.KB_DATA_DIR, "qdrant")
-            client = qdrant_client.QdrantClient(path=local_path)
+            import qdrant_client
+            
+            # Connect to Qdrant
+            if settings.VECTOR_DB_URL:
+                client = qdrant_client.QdrantClient(url=settings.VECTOR_DB_URL, api_key=settings.VECTOR_DB_API_KEY)
+            else:
+                local_path = os.path.join(settings.KB_DATA_DIR, "qdrant")
+                client = qdrant_client.QdrantClient(path=local_path)
         
         # Delete the collection
         client.delete_collection(collection_name=settings.VECTOR_DB_COLLECTION)
@@ -118,14 +346,30 @@ def delete_collection() -> None:
     elif settings.VECTOR_DB_TYPE.lower() == "pinecone":
         import pinecone
         
-        # Initialize Pinecone
-        pinecone.init(
-            api_key=settings.VECTOR_DB_API_KEY,
-            environment=settings.VECTOR_DB_URL
-        )
+        # get_vector_store already initialized Pinecone if an instance exists
+        if _vector_store_instance is None:
+            pinecone.init(
+                api_key=settings.VECTOR_DB_API_KEY,
+                environment=settings.VECTOR_DB_URL
+            )
         
         # Delete the index
         pinecone.delete_index(settings.VECTOR_DB_COLLECTION)
     
     # Reset the instance
-    _vector_store_instance = None
\ No newline at end of file
+    _vector_store_instance = None
+
+def reset_collection() -> None:
+    """
+    Delete the collection and, for Chroma, recreate it tuned for bulk ingest.
+    
+    The HNSW settings are only ever passed here, where the collection is known
+    not to exist, so serving paths never send metadata that could conflict
+    with an existing collection.
+    """
+    global _vector_store_instance
+    
+    delete_collection()
+    
+    if settings.VECTOR_DB_TYPE.lower() == "chroma":
+        _vector_store_instance = _create_chroma(get_embedding_model(), _CHROMA_HNSW_METADATA)
\ No newline at end of file
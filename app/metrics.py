@@ -0,0 +1,38 @@
+"""
+Prometheus metrics for the Crypto AI Agent.
+"""
+from typing import Any
+
+# prometheus_client is optional; without it metrics are silently discarded
+try:
+    from prometheus_client import Histogram, CONTENT_TYPE_LATEST, generate_latest
+except ImportError:
+    Histogram = None
+    CONTENT_TYPE_LATEST = "text/plain"
+    generate_latest = None
+
+
+class _NoopMetric:
+    """Stand-in for a Prometheus metric when prometheus_client is not installed."""
+    
+    def labels(self, *args: Any, **kwargs: Any) -> "_NoopMetric":
+        return self
+    
+    def observe(self, amount: float) -> None:
+        pass
+
+
+if Histogram is not None:
+    TOOL_LATENCY = Histogram(
+        "agent_tool_latency_seconds",
+        "Tool call latency",
+        ["tool", "endpoint", "status"]
+    )
+    AGENT_LATENCY = Histogram(
+        "agent_process_message_seconds",
+        "End-to-end latency of CryptoAgent.process_message",
+        ["status"]
+    )
+else:
+    TOOL_LATENCY = _NoopMetric()
+    AGENT_LATENCY = _NoopMetric()
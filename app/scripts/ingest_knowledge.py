@@ -3,6 +3,7 @@
 Script to ingest knowledge base documents into the vector database.
 """
 import argparse
+import asyncio
 import os
 import sys
 import time
@@ -49,12 +50,12 @@ def main():
     start_time = time.time()
     print(f"Starting ingestion from {args.directory}...")
     
-    num_docs = ingest_documents(
+    num_docs = asyncio.run(ingest_documents(
         directory=args.directory,
         chunk_size=args.chunk_size,
         chunk_overlap=args.chunk_overlap,
         reset=args.reset
-    )
+    ))
     
     end_time = time.time()
     duration = end_time - start_time
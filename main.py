@@ -2,13 +2,29 @@
 Crypto AI Agent - Main Application Entry Point
 This module initializes and runs the FastAPI application.
 """
+from app import _compat  # noqa: F401  (must run before any LangChain agent imports)
 import os
+import asyncio
+import logging
+import multiprocessing
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.endpoints import router
 from app.config import settings
 
+logging.basicConfig(level=settings.LOG_LEVEL)
+logger = logging.getLogger(__name__)
+
+# Spawned ingest workers re-import this module as __mp_main__ and must not load the model too
+if settings.PRELOAD_MODELS and multiprocessing.parent_process() is None:
+    # Loaded at import so `gunicorn --preload` shares it copy-on-write across workers
+    from app.knowledge_base.embeddings import get_embedding_model
+    try:
+        get_embedding_model()
+    except Exception as e:
+        logger.warning("Skipping embedding model preload: %s", e)
+
 app = FastAPI(
     title="Crypto AI Agent",
     description="An AI agent for cryptocurrency information powered by Groq Kimi2",
@@ -26,6 +42,37 @@ app.add_middleware(
 
 app.include_router(router)
 
+@app.on_event("startup")
+async def warm_knowledge_base():
+    """Load the embedding model, open the vector store and fetch the Binance symbol list at boot so the first request doesn't pay for it."""
+    if not settings.WARMUP_ON_STARTUP:
+        return
+    
+    from app.knowledge_base.embeddings import get_embedding_model
+    from app.knowledge_base.vector_store import get_vector_store
+    from app.agent.agent import _shared_executor
+    from app.agent.tools.binance_tool import warm_valid_symbols
+    
+    loop = asyncio.get_running_loop()
+    # A knowledge base failure must not keep the API (and price-only chat) from booting
+    try:
+        await loop.run_in_executor(None, get_embedding_model)
+    except Exception as e:
+        logger.warning("Skipping embedding model warm-up: %s", e)
+    try:
+        await loop.run_in_executor(None, get_vector_store)
+    except Exception as e:
+        logger.warning("Skipping vector store warm-up: %s", e)
+    try:
+        # Builds the shared agent, whose KnowledgeBaseTool opens the vector store
+        await loop.run_in_executor(None, _shared_executor)
+    except Exception as e:
+        logger.warning("Skipping agent warm-up: %s", e)
+    try:
+        await warm_valid_symbols()
+    except Exception as e:
+        logger.warning("Skipping Binance symbol list warm-up: %s", e)
+
 if __name__ == "__main__":
     # Use PORT environment variable provided by Render
     port = int(os.environ.get("PORT", settings.PORT))
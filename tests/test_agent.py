@@ -0,0 +1,54 @@
+"""
+Tests for the agent's per-session conversation memory.
+"""
+from cachetools import TTLCache
+
+from app.agent.agent import CryptoAgent
+from app.config import settings
+
+
+def _agent():
+    # Skip __init__ so no LLM or tools are built
+    agent = CryptoAgent.__new__(CryptoAgent)
+    agent._sessions = TTLCache(maxsize=16, ttl=60)
+    return agent
+
+
+def test_memory_grows_until_twice_the_window(monkeypatch):
+    monkeypatch.setattr(settings, "MEMORY_WINDOW", 2)
+    agent = _agent()
+    
+    for turn in range(4):
+        agent._update_memory("s", f"q{turn}", f"a{turn}")
+    
+    assert len(agent.get_history("s")) == 8
+
+
+def test_memory_cuts_back_to_the_window(monkeypatch):
+    monkeypatch.setattr(settings, "MEMORY_WINDOW", 2)
+    agent = _agent()
+    
+    for turn in range(5):
+        agent._update_memory("s", f"q{turn}", f"a{turn}")
+    
+    assert [m.content for m in agent.get_history("s")] == ["q3", "a3", "q4", "a4"]
+
+
+def test_memory_prefix_is_stable_between_cuts(monkeypatch):
+    monkeypatch.setattr(settings, "MEMORY_WINDOW", 2)
+    agent = _agent()
+    
+    for turn in range(5):
+        agent._update_memory("s", f"q{turn}", f"a{turn}")
+    before = agent._format_chat_history("s")
+    agent._update_memory("s", "q5", "a5")
+    
+    assert agent._format_chat_history("s")[:len(before)] == before
+
+
+def test_sessions_are_isolated():
+    agent = _agent()
+    agent._update_memory("a", "hi", "hello")
+    
+    assert agent.get_history("b") == []
+    assert [m.content for m in agent._format_chat_history("a")] == ["hi", "hello"]
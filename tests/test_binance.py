@@ -0,0 +1,118 @@
+"""
+Tests for the Binance ticker batcher and request rate limiting.
+"""
+import time
+import asyncio
+
+import pytest
+
+from app.agent.tools.binance_tool import _InvalidRequestError, _TickerBatcher, _TokenBucket
+
+
+class _FakeTool:
+    """Stands in for BinancePriceTool, recording the requests the batcher makes."""
+    
+    def __init__(self, invalid=(), batch_error=None):
+        self.single_calls = []
+        self.batch_calls = []
+        self._invalid = set(invalid)
+        self._batch_error = batch_error
+    
+    async def _aget_ticker_24hr(self, symbol):
+        self.single_calls.append(symbol)
+        if symbol in self._invalid:
+            raise _InvalidRequestError(f"Invalid symbol or parameters: {symbol}")
+        return {"symbol": symbol}
+    
+    async def _aget_ticker_24hr_batch(self, symbols):
+        self.batch_calls.append(list(symbols))
+        if self._batch_error is not None:
+            raise self._batch_error
+        if self._invalid.intersection(symbols):
+            raise _InvalidRequestError("Invalid symbol or parameters")
+        return [{"symbol": symbol} for symbol in symbols]
+
+
+def _submit_all(batcher, tool, symbols):
+    async def run():
+        return await asyncio.gather(
+            *(batcher.submit(tool, symbol) for symbol in symbols),
+            return_exceptions=True
+        )
+    return asyncio.run(run())
+
+
+def test_batcher_coalesces_and_dedupes():
+    tool = _FakeTool()
+    results = _submit_all(_TickerBatcher(0.01), tool, ["ETHUSDT", "BTCUSDT", "ETHUSDT"])
+    
+    assert results == [{"symbol": "ETHUSDT"}, {"symbol": "BTCUSDT"}, {"symbol": "ETHUSDT"}]
+    assert tool.batch_calls == [["BTCUSDT", "ETHUSDT"]]
+    assert tool.single_calls == []
+
+
+def test_batcher_fans_out_on_invalid_symbol():
+    tool = _FakeTool(invalid={"FAKEUSDT"})
+    results = _submit_all(_TickerBatcher(0.01), tool, ["BTCUSDT", "FAKEUSDT"])
+    
+    assert results[0] == {"symbol": "BTCUSDT"}
+    assert isinstance(results[1], _InvalidRequestError)
+    assert sorted(tool.single_calls) == ["BTCUSDT", "FAKEUSDT"]
+
+
+def test_batcher_propagates_other_errors_without_fan_out():
+    tool = _FakeTool(batch_error=Exception("Rate limit exceeded - too many requests"))
+    results = _submit_all(_TickerBatcher(0.01), tool, ["BTCUSDT", "ETHUSDT"])
+    
+    assert all(str(r) == "Rate limit exceeded - too many requests" for r in results)
+    assert tool.single_calls == []
+
+
+def test_batcher_survives_separate_event_loops():
+    batcher = _TickerBatcher(0.01)
+    
+    for _ in range(2):
+        assert _submit_all(batcher, _FakeTool(), ["BTCUSDT"]) == [{"symbol": "BTCUSDT"}]
+
+
+def test_batcher_without_window_calls_directly():
+    tool = _FakeTool()
+    _submit_all(_TickerBatcher(0), tool, ["BTCUSDT", "ETHUSDT"])
+    
+    assert tool.single_calls == ["BTCUSDT", "ETHUSDT"]
+    assert tool.batch_calls == []
+
+
+def test_token_bucket_spends_burst_without_waiting():
+    bucket = _TokenBucket(rate=1, capacity=10)
+    
+    async def run():
+        for _ in range(5):
+            await bucket.acquire(2)
+    
+    start = time.monotonic()
+    asyncio.run(run())
+    
+    assert time.monotonic() - start < 0.1
+
+
+def test_token_bucket_waits_for_refill():
+    bucket = _TokenBucket(rate=100, capacity=10)
+    
+    async def run():
+        await bucket.acquire(10)
+        await bucket.acquire(5)
+    
+    start = time.monotonic()
+    asyncio.run(run())
+    
+    assert time.monotonic() - start == pytest.approx(0.05, abs=0.04)
+
+
+def test_token_bucket_caps_oversized_requests():
+    bucket = _TokenBucket(rate=1, capacity=10)
+    
+    async def run():
+        await asyncio.wait_for(bucket.acquire(50), timeout=1)
+    
+    asyncio.run(run())
@@ -0,0 +1,75 @@
+"""
+Tests for knowledge base loading and chunking.
+"""
+import orjson
+from langchain_core.documents import Document
+
+from app.knowledge_base.ingest import _json_text, _load_json, _make_split_text, _merge_tiny, _resplit_oversize
+
+
+def _doc(text, source="a.md"):
+    return Document(page_content=text, metadata={"source": source})
+
+
+def test_json_text_matches_jsonloader():
+    assert _json_text("plain") == "plain"
+    assert _json_text({"a": 1}) == '{"a":1}'
+    assert _json_text([1, 2]) == "[1,2]"
+    assert _json_text({}) == ""
+    assert _json_text([]) == ""
+    assert _json_text(None) == ""
+    assert _json_text(3.5) == "3.5"
+    assert _json_text(True) == "True"
+
+
+def test_load_json_array(tmp_path):
+    path = tmp_path / "docs.json"
+    path.write_bytes(orjson.dumps(["first", {"q": "x"}, None]))
+    
+    docs = _load_json(str(path))
+    
+    assert [d.page_content for d in docs] == ["first", '{"q":"x"}', ""]
+    assert [d.metadata["seq_num"] for d in docs] == [1, 2, 3]
+    assert all(d.metadata["source"] == str(path) for d in docs)
+
+
+def test_load_json_object_uses_values(tmp_path):
+    path = tmp_path / "docs.json"
+    path.write_bytes(orjson.dumps({"a": "one", "b": "two"}))
+    
+    assert [d.page_content for d in _load_json(str(path))] == ["one", "two"]
+
+
+def test_load_json_empty_file(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_bytes(b"")
+    
+    assert _load_json(str(path)) == []
+
+
+def test_resplit_oversize_cuts_fixed_windows():
+    docs = _resplit_oversize([_doc("short"), _doc("x" * 25)], max_size=10)
+    
+    assert [len(d.page_content) for d in docs] == [5, 10, 10, 5]
+    assert all(d.metadata == {"source": "a.md"} for d in docs)
+
+
+def test_merge_tiny_folds_into_neighbour():
+    docs = _merge_tiny([_doc("a" * 50), _doc("b" * 5), _doc("c" * 50)], min_size=10, max_size=60)
+    
+    assert [d.page_content for d in docs] == ["a" * 50 + "\n" + "b" * 5, "c" * 50]
+
+
+def test_merge_tiny_respects_max_size_and_source():
+    docs = _merge_tiny([_doc("a" * 50), _doc("b" * 5, source="b.md"), _doc("c" * 58, source="b.md")], min_size=10, max_size=60)
+    
+    assert [len(d.page_content) for d in docs] == [50, 5, 58]
+
+
+def test_split_text_accepts_large_overlap():
+    # Overlaps of half the chunk size or more must still build a splitter
+    split_text = _make_split_text(100, 60)
+    chunks = split_text("word " * 200)
+    
+    assert chunks
+    assert all(len(chunk) <= 100 for chunk in chunks)